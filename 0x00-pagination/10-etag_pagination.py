@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Module for serving cached hypermedia pages with ETags.
+
+This module defines a Server that caches each hypermedia page as
+serialized JSON bytes, keyed by (dataset version, page, page_size),
+along with a content hash used as its ETag. A repeat request for a hot
+page is a dict lookup, and a client sending the ETag back gets a 304
+without the body.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+BaseServer = __import__('9-reloading_server').Server
+
+
+class Server(BaseServer):
+    """Server class answering page requests from a response cache.
+
+    PAGE_CACHE_SIZE bounds the number of cached pages; the least
+    recently used ones are dropped first, which also retires the pages
+    of older dataset versions.
+    """
+    PAGE_CACHE_SIZE = 1024
+
+    def __init__(self):
+        super().__init__()
+        self.__pages = OrderedDict()
+        self.__pages_lock = threading.Lock()
+
+    def render_hyper(self, page: int, page_size: int) -> Tuple[int, bytes]:
+        """Build the JSON body of a hypermedia page.
+
+        Returns:
+        Tuple: The version of the snapshot used and the body bytes.
+        """
+        payload = self.get_hyper(page, page_size)
+        return payload['version'], json.dumps(payload).encode()
+
+    def get_hyper_response(self, page: int = 1, page_size: int = 10,
+                           if_none_match: str = None
+                           ) -> Tuple[int, Dict[str, str], bytes]:
+        """Get the HTTP response for a hypermedia page.
+
+        Parameters:
+        page (int): The page number (1-indexed).
+        page_size (int): The number of items per page.
+        if_none_match (str): The If-None-Match header of the request.
+
+        Returns:
+        Tuple: The status code (200 or 304), the headers and the body.
+        """
+        key = (self.snapshot().version, page, page_size)
+        with self.__pages_lock:
+            cached = self.__pages.get(key)
+            if cached is not None:
+                self.__pages.move_to_end(key)
+        if cached is None:
+            version, body = self.render_hyper(page, page_size)
+            etag = '"{}"'.format(hashlib.blake2b(
+                body, digest_size=16).hexdigest())
+            # Cache under the version the body was built from
+            key = (version, page, page_size)
+            cached = (body, etag)
+            with self.__pages_lock:
+                self.__pages[key] = cached
+                if len(self.__pages) > self.PAGE_CACHE_SIZE:
+                    self.__pages.popitem(last=False)
+
+        body, etag = cached
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if if_none_match is not None and etag in (
+                tag.strip() for tag in if_none_match.split(',')):
+            return 304, headers, b''
+        headers['Content-Type'] = 'application/json'
+        headers['Content-Length'] = str(len(body))
+        return 200, headers, body
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('10-etag_pagination').Server
+
+server = Server()
+
+status, headers, body = server.get_hyper_response(1, 2)
+print(status, headers)
+print(body.decode())
+print("---")
+status, headers, body = server.get_hyper_response(
+    1, 2, if_none_match=headers['ETag'])
+print(status, headers, body)
+print("---")
+status, headers, body = server.get_hyper_response(
+    2, 2, if_none_match=headers['ETag'])
+print(status, headers['ETag'], len(body))
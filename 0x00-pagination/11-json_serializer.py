@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Module for serializing pagination payloads from pre-encoded rows.
+
+This module defines a Server whose JSON bodies are joined from byte
+fragments instead of being encoded field by field on every request.
+Each row of a snapshot is encoded once, when the snapshot is loaded,
+and a page body is the encoded page fields around the joined row
+fragments. orjson is used to encode when it is installed.
+"""
+
+import json
+import threading
+from typing import Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BaseServer = __import__('10-etag_pagination').Server
+_hyper_index = __import__('3-hypermedia_del_pagination')._hyper_index
+
+
+def encode(value) -> bytes:
+    """Encode a value as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':')).encode()
+
+
+def encode_payload(payload: Dict, rows: List[bytes]) -> bytes:
+    """Encode a pagination payload around pre-encoded rows.
+
+    Parameters:
+    payload (Dict): The payload, whose 'data' field is not encoded.
+    rows (List[bytes]): The encoded rows of payload['data'].
+
+    Returns:
+    bytes: The same JSON document as encode(payload).
+    """
+    parts = []
+    for key, value in payload.items():
+        if key == 'data':
+            value = b'[' + b','.join(rows) + b']'
+        else:
+            value = encode(value)
+        parts.append(encode(key) + b':' + value)
+    return b'{' + b','.join(parts) + b'}'
+
+
+class Server(BaseServer):
+    """Server class rendering pages from rows encoded at load time."""
+
+    def __init__(self):
+        super().__init__()
+        self.__encoded = (None, [])
+        self.__encode_lock = threading.Lock()
+
+    def reload(self) -> bool:
+        """Load DATA_FILE again and encode the rows of a new snapshot."""
+        reloaded = super().reload()
+        if reloaded:
+            self.encoded_rows()
+        return reloaded
+
+    def encoded_rows(self, snapshot=None) -> List[bytes]:
+        """Encoded rows of a snapshot, aligned with its dataset.
+
+        When the snapshot only appended rows to the previous one, the
+        previous encodings are kept and only the new rows are encoded.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        encoded_snapshot, rows = self.__encoded
+        if encoded_snapshot is snapshot:
+            return rows
+        with self.__encode_lock:
+            encoded_snapshot, rows = self.__encoded
+            if encoded_snapshot is snapshot:
+                return rows
+            dataset = snapshot.dataset
+            kept = 0
+            if encoded_snapshot is not None:
+                old = encoded_snapshot.dataset
+                if 0 < len(old) <= len(dataset) and \
+                        dataset[len(old) - 1] is old[-1]:
+                    kept = len(old)
+            rows = rows[:kept] + [encode(row) for row in dataset[kept:]]
+            self.__encoded = (snapshot, rows)
+            return rows
+
+    def render_hyper(self, page: int, page_size: int) -> Tuple[int, bytes]:
+        """Build the JSON body of a hypermedia page from encoded rows.
+
+        Returns:
+        Tuple: The version of the snapshot used and the body bytes.
+        """
+        snapshot = self.snapshot()
+        payload = self.get_hyper(page, page_size)
+        if payload['version'] == snapshot.version:
+            start_index = (page - 1) * page_size
+            rows = self.encoded_rows(snapshot)[
+                start_index:start_index + payload['page_size']]
+        else:  # Reloaded in between
+            rows = [encode(row) for row in payload['data']]
+        return payload['version'], encode_payload(payload, rows)
+
+    def render_hyper_index(self, index: int = None,
+                           page_size: int = 10) -> bytes:
+        """Build the JSON body of a deletion-resilient page.
+
+        The page is built like get_hyper_index, from a single snapshot.
+        Rows replaced since the snapshot was loaded are encoded on the
+        spot; all other rows come from the encoded snapshot.
+        """
+        snapshot = self.snapshot()
+        payload, indexes = _hyper_index(snapshot.indexed_dataset, index,
+                                        page_size)
+
+        dataset = snapshot.dataset
+        rows = self.encoded_rows(snapshot)
+        fragments = []
+        for i, row in zip(indexes, payload['data']):
+            if i < len(dataset) and dataset[i] is row:
+                fragments.append(rows[i])
+            else:
+                fragments.append(encode(row))
+        return encode_payload(payload, fragments)
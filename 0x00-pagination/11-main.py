@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import json
+
+Server = __import__('11-json_serializer').Server
+
+server = Server()
+
+version, body = server.render_hyper(1, 2)
+print(version, body.decode())
+print(json.loads(body) == server.get_hyper(1, 2))
+print("---")
+server.delete_row(4)
+body = server.render_hyper_index(3, 3)
+print(body.decode())
+print(json.loads(body) == server.get_hyper_index(3, 3))
+print("---")
+status, headers, body = server.get_hyper_response(3, 2)
+print(status, headers['Content-Length'], len(body))
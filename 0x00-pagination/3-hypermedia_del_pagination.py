@@ -5,7 +5,99 @@ Deletion-resilient hypermedia pagination
 
 import csv
 import math
-from typing import List, Dict
+from bisect import bisect_left, insort
+from collections.abc import MutableMapping
+from typing import List, Dict, Tuple
+
+
+class IndexedDataset(MutableMapping):
+    """Dataset rows by index, with a sorted list of the live indexes.
+
+    The rows are held in a private dict and every mutation, including
+    the update, pop, popitem, setdefault and clear mixins, goes through
+    __setitem__ and __delitem__, which keep the list in sync. The next
+    rows from any index are then found by bisection instead of probing
+    deleted indexes one by one.
+    """
+
+    def __init__(self, rows: List[List]):
+        self.__rows = dict(enumerate(rows))
+        self.live = list(range(len(rows)))
+
+    def __getitem__(self, index: int) -> List:
+        return self.__rows[index]
+
+    def __setitem__(self, index: int, row: List) -> None:
+        if index not in self.__rows:
+            if not self.live or index > self.live[-1]:
+                self.live.append(index)
+            else:
+                insort(self.live, index)
+        self.__rows[index] = row
+
+    def __delitem__(self, index: int) -> None:
+        del self.__rows[index]
+        del self.live[bisect_left(self.live, index)]
+
+    def __contains__(self, index) -> bool:
+        return index in self.__rows
+
+    def __iter__(self):
+        return iter(self.live)
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def clear(self) -> None:
+        """Remove every row."""
+        self.__rows.clear()
+        self.live.clear()
+
+    def copy(self) -> 'IndexedDataset':
+        """Return an independent copy sharing the row objects."""
+        other = IndexedDataset([])
+        other.__rows = dict(self.__rows)
+        other.live = list(self.live)
+        return other
+
+    def extend(self, rows: List[List], start: int) -> None:
+        """Store rows at the indexes following `start`."""
+        for index, row in enumerate(rows, start):
+            self[index] = row
+
+    def next_indexes(self, index: int, count: int) -> List[int]:
+        """Return up to `count` live indexes, starting at `index`."""
+        start = bisect_left(self.live, index)
+        return self.live[start:start + count]
+
+    def end(self) -> int:
+        """Return one past the last live index."""
+        return self.live[-1] + 1 if self.live else 0
+
+
+def _hyper_index(indexed_dataset: IndexedDataset, index: int,
+                 page_size: int) -> Tuple[Dict, List[int]]:
+    """Build a deletion-resilient page of an indexed dataset.
+
+    Returns:
+    Tuple: The page dictionary and the dataset indexes of its rows.
+    """
+    assert index is not None and 0 <= index < indexed_dataset.end(), \
+        "Index is out of range"
+
+    # Collect page_size live indexes from index, skipping deleted ones
+    indexes = indexed_dataset.next_indexes(index, page_size)
+    data = [indexed_dataset[i] for i in indexes]
+
+    next_index = indexes[-1] + 1 if indexes else index
+    if next_index >= indexed_dataset.end():
+        next_index = None
+    return {
+        'index': index,
+        'data': data,
+        'page_size': len(data),
+        'next_index': next_index
+    }, indexes
 
 
 class Server:
@@ -32,12 +124,26 @@ class Server:
         """Dataset indexed by sorting position, starting at 0
         """
         if self.__indexed_dataset is None:
-            dataset = self.dataset()
-            self.__indexed_dataset = {
-                i: dataset[i] for i in range(len(dataset))
-            }
+            self.__indexed_dataset = IndexedDataset(self.dataset())
         return self.__indexed_dataset
 
+    def delete_row(self, index: int) -> None:
+        """Delete the row at an index.
+
+        Parameters:
+        index (int): The index of the row to delete.
+        """
+        del self.indexed_dataset()[index]
+
+    def insert_row(self, index: int, row: List) -> None:
+        """Insert or replace the row at an index.
+
+        Parameters:
+        index (int): The index of the row.
+        row (List): The row to store.
+        """
+        self.indexed_dataset()[index] = row
+
     def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
         """Method to get a hypermedia pagination dictionary.
 
@@ -46,23 +152,7 @@ class Server:
         page_size (int): The number of items per page.
 
         Returns:
-        Dict: A dictionary containing the pagination details.
+        Dict: A dictionary containing the pagination details, with a
+        next_index of None once the last row is reached.
         """
-        assert 0 <= index < len(self.__indexed_dataset), \
-            "Index is out of range"
-
-        data = []
-        # Skip to index, collecting page_size items, skipping deleted indexes
-        current_index = index
-        while len(data) < page_size:
-            if current_index in self.__indexed_dataset:
-                data.append(self.__indexed_dataset[current_index])
-            current_index += 1
-
-        next_index = current_index
-        return {
-            'index': index,
-            'data': data,
-            'page_size': len(data),
-            'next_index': next_index
-        }
+        return _hyper_index(self.indexed_dataset(), index, page_size)[0]
@@ -28,7 +28,7 @@ print(res)
 print(server.get_hyper_index(res.get('next_index'), page_size))
 
 # 3- remove the first index
-del server._Server__indexed_dataset[res.get('index')]
+server.delete_row(res.get('index'))
 print("Nb items: {}".format(len(server._Server__indexed_dataset)))
 
 # 4- request again the initial index -> the first data retreives is not the same as the first request
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Module for paginating a columnar copy of the baby names dataset.
+
+This module defines a ColumnarDataset that stores each CSV column in a
+typed array: integer columns as machine integers and string columns as
+dictionary-encoded codes. Rows are only built as lists of strings for
+the slice being paginated. The Server class here pages through it with
+the same API as the hypermedia Server.
+"""
+
+import csv
+from array import array
+from bisect import bisect_left
+from typing import List
+
+BaseServer = __import__('2-hypermedia_pagination').Server
+
+
+class IntColumn:
+    """Column of integers, stored in an array of machine integers."""
+    PAD = 0  # Stored for the missing cells of short rows
+
+    def __init__(self, values=()):
+        self.values = array('q', values)
+
+    def append(self, value: int) -> None:
+        """Append an integer."""
+        self.values.append(value)
+
+    def strings(self, start: int, end: int) -> List[str]:
+        """Return the values of rows start to end as strings."""
+        return [str(value) for value in self.values[start:end]]
+
+
+class CategoryColumn:
+    """Column of strings, dictionary-encoded.
+
+    Each distinct string is stored once in `categories`, and each row
+    only holds the code of its string.
+    """
+    PAD = ''
+
+    def __init__(self, values=()):
+        self.categories = []
+        self.codes_by_value = {}
+        self.codes = array('I')
+        for value in values:
+            self.append(value)
+
+    def append(self, value: str) -> None:
+        """Append a string, encoding it."""
+        code = self.codes_by_value.get(value)
+        if code is None:
+            code = self.codes_by_value[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def strings(self, start: int, end: int) -> List[str]:
+        """Return the values of rows start to end."""
+        categories = self.categories
+        return [categories[code] for code in self.codes[start:end]]
+
+
+class ColumnarDataset:
+    """Rows of a CSV file stored column by column.
+
+    A column stays an IntColumn while every value is an integer that
+    fits in 64 bits and prints back identically, otherwise it becomes a
+    CategoryColumn. Indexing with a slice returns the rows as lists of
+    strings, like slicing the List[List[str]] dataset does.
+
+    Rows shorter than the header, such as the [] of a blank line, are
+    padded in the columns and cut back to their width when read, so
+    they come back as they were read. Longer rows raise ValueError.
+    """
+
+    def __init__(self, header: List[str], rows):
+        self.header = header
+        self.columns = [IntColumn() for _ in header]
+        self.length = 0
+        self.short_rows = []    # Indexes of the short rows, sorted
+        self.short_widths = []  # Their number of cells
+        for row in rows:
+            if len(row) > len(header):
+                raise ValueError(
+                    "row {} has {} cells but the header has {}".format(
+                        self.length, len(row), len(header)))
+            if len(row) < len(header):
+                self.short_rows.append(self.length)
+                self.short_widths.append(len(row))
+            for i, column in enumerate(self.columns):
+                if i >= len(row):
+                    column.append(column.PAD)
+                    continue
+                value = row[i]
+                if isinstance(column, IntColumn):
+                    try:
+                        number = int(value)
+                    except ValueError:
+                        number = None
+                    if number is not None and str(number) == value:
+                        try:
+                            column.append(number)
+                            continue
+                        except OverflowError:
+                            pass  # Wider than 64 bits
+                    column = self.columns[i] = CategoryColumn(
+                        column.strings(0, self.length))
+                column.append(value)
+            self.length += 1
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        """Return one row, or a list of rows for a slice."""
+        if isinstance(index, slice):
+            start, end, step = index.indices(self.length)
+            assert step == 1, "Only contiguous slices are supported"
+            rows = [list(row) for row in zip(
+                *(column.strings(start, end) for column in self.columns))]
+            if not self.columns:
+                rows = [[] for _ in range(start, end)]
+            i = bisect_left(self.short_rows, start)
+            while i < len(self.short_rows) and self.short_rows[i] < end:
+                del rows[self.short_rows[i] - start][self.short_widths[i]:]
+                i += 1
+            return rows
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("row index out of range")
+        return self[index:index + 1][0]
+
+    def column(self, name: str):
+        """Return the column object of a header name."""
+        return self.columns[self.header.index(name)]
+
+
+class Server(BaseServer):
+    """Server class to paginate a columnar database of baby names."""
+
+    def __init__(self):
+        super().__init__()
+        self.__columnar = None
+
+    def dataset(self) -> ColumnarDataset:
+        """Cached columnar dataset."""
+        if self.__columnar is None:
+            with open(self.DATA_FILE) as f:
+                reader = csv.reader(f)
+                header = next(reader)
+                self.__columnar = ColumnarDataset(header, reader)
+        return self.__columnar
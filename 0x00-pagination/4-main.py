@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import tracemalloc
+
+Server = __import__('4-columnar_dataset').Server
+ListServer = __import__('2-hypermedia_pagination').Server
+
+tracemalloc.start()
+server = Server()
+server.dataset()
+columnar_size = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+tracemalloc.start()
+list_server = ListServer()
+list_server.dataset()
+list_size = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+print("List dataset: {} bytes".format(list_size))
+print("Columnar dataset: {} bytes".format(columnar_size))
+print(server.get_page(1, 3) == list_server.get_page(1, 3))
+print(server.get_hyper(1, 2))
+print(server.get_hyper(3000, 100))
+print([type(column).__name__ for column in server.dataset().columns])
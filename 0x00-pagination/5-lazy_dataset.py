@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Module for paginating a CSV file lazily through a row offset index.
+
+This module defines a LazyDataset that makes one pass over the CSV
+file to record the byte offset of every row, or loads those offsets
+from a sidecar index file. Rows are then parsed on demand from a
+memory-mapped file, so serving a page costs O(page_size) instead of
+parsing the whole dataset first.
+"""
+
+import csv
+import io
+import mmap
+import os
+from array import array
+
+BaseServer = __import__('2-hypermedia_pagination').Server
+
+
+def build_offsets(path: str) -> array:
+    """
+    Returns the byte offset of every row of a CSV file, header included.
+
+    A newline inside a quoted field does not start a new row.
+
+    Parameters:
+    path (str): The CSV file.
+
+    Returns:
+    array: An array('Q') of row start offsets.
+    """
+    offsets = array('Q')
+    position = 0
+    in_quotes = False
+    with open(path, 'rb') as f:
+        for line in f:
+            if not in_quotes:
+                offsets.append(position)
+            in_quotes ^= line.count(b'"') & 1
+            position += len(line)
+    return offsets
+
+
+def load_offsets(path: str, index_path: str) -> array:
+    """
+    Returns the row offsets of a CSV file from its sidecar index,
+    rebuilding and saving the index when it is missing or stale.
+
+    The index starts with the size and modification time of the CSV
+    file it was built from.
+    """
+    stat = os.stat(path)
+    stamp = array('Q', [stat.st_size, stat.st_mtime_ns])
+    try:
+        with open(index_path, 'rb') as f:
+            saved = array('Q')
+            saved.frombytes(f.read())
+        if saved[:2] == stamp:
+            return saved[2:]
+    except (OSError, ValueError):
+        pass
+    offsets = build_offsets(path)
+    try:
+        with open(index_path, 'wb') as f:
+            f.write((stamp + offsets).tobytes())
+    except OSError:
+        pass  # The index is only a cache
+    return offsets
+
+
+class LazyDataset:
+    """Rows of a CSV file, parsed on demand.
+
+    Supports len() and slicing like the List[List[str]] dataset, the
+    header row excluded.
+    """
+
+    def __init__(self, path: str, index_path: str = None):
+        offsets = (build_offsets(path) if index_path is None
+                   else load_offsets(path, index_path))
+        self.file = open(path, 'rb')
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.data = mmap.mmap(self.file.fileno(), 0,
+                              access=mmap.ACCESS_READ) if self.size else b''
+        self.offsets = offsets[1:]  # Skip the header row
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """Return one row, or a list of rows for a slice."""
+        if isinstance(index, slice):
+            start, end, step = index.indices(len(self.offsets))
+            assert step == 1, "Only contiguous slices are supported"
+            if start >= end:
+                return []
+            first = self.offsets[start]
+            last = self.offsets[end] if end < len(self.offsets) else self.size
+            text = self.data[first:last].decode()
+            return list(csv.reader(io.StringIO(text, newline='')))
+        if index < 0:
+            index += len(self.offsets)
+        if not 0 <= index < len(self.offsets):
+            raise IndexError("row index out of range")
+        return self[index:index + 1][0]
+
+    def close(self) -> None:
+        """Release the mapped file."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+
+class Server(BaseServer):
+    """Server class to paginate a lazily parsed database of baby names.
+
+    With use_index, the row offsets are kept in a sidecar file next to
+    DATA_FILE, so restarts skip the indexing pass.
+    """
+
+    def __init__(self, use_index: bool = True):
+        super().__init__()
+        self.use_index = use_index
+        self.__lazy = None
+
+    def dataset(self) -> LazyDataset:
+        """Cached lazy dataset."""
+        if self.__lazy is None:
+            index_path = self.DATA_FILE + ".idx" if self.use_index else None
+            self.__lazy = LazyDataset(self.DATA_FILE, index_path)
+        return self.__lazy
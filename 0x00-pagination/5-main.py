@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import time
+
+Server = __import__('5-lazy_dataset').Server
+ListServer = __import__('2-hypermedia_pagination').Server
+
+start = time.perf_counter()
+print(Server().get_page(1, 3))
+print("Lazy first page: {:.4f}s".format(time.perf_counter() - start))
+
+start = time.perf_counter()
+print(Server().get_page(1, 3))
+print("Lazy first page with index: {:.4f}s".format(
+    time.perf_counter() - start))
+
+start = time.perf_counter()
+print(ListServer().get_page(1, 3))
+print("Full load first page: {:.4f}s".format(time.perf_counter() - start))
+
+server = Server()
+print(server.get_hyper(3, 2) == ListServer().get_hyper(3, 2))
+print(server.get_hyper(3000, 100))
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Module for cursor-based (keyset) pagination of the baby names dataset.
+
+This module defines a Server that pages through the dataset in the
+order of any column. Each page returns an opaque, signed cursor naming
+the last row served, and the next page starts right after that row in
+a precomputed sort index, so deep pages cost the same as the first one
+and do not shift when rows are added or removed before them.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+BaseServer = __import__('2-hypermedia_pagination').Server
+
+SORT_KEYS = {
+    'year': (0, int),
+    'gender': (1, str),
+    'ethnicity': (2, str),
+    'name': (3, str),
+    'count': (4, int),
+    'rank': (5, int),
+}
+
+
+class Server(BaseServer):
+    """Server class to paginate a database of baby names with cursors.
+
+    CURSOR_SECRET signs the cursors. It defaults to a random key, so
+    cursors are only valid for the process that issued them unless a
+    shared secret is set.
+    """
+    CURSOR_SECRET = None
+
+    def __init__(self):
+        super().__init__()
+        self.secret = self.CURSOR_SECRET or os.urandom(32)
+        self.__sort_indexes = {}
+
+    def sort_index(self, sort_key: str) -> Tuple[List[int], List, List]:
+        """Row positions ordered by a column, ties broken by position.
+
+        Parameters:
+        sort_key (str): One of the SORT_KEYS.
+
+        Returns:
+        Tuple: The cached sort index, the typed values of the column and
+        the (value, position) pair of every row of the index, in order,
+        for bisecting to a cursor.
+        """
+        assert sort_key in SORT_KEYS, "Unknown sort key"
+        if sort_key not in self.__sort_indexes:
+            column, kind = SORT_KEYS[sort_key]
+            values = [kind(row[column]) for row in self.dataset()]
+            order = sorted(range(len(values)), key=values.__getitem__)
+            keys = [(values[row], row) for row in order]
+            self.__sort_indexes[sort_key] = (order, values, keys)
+        return self.__sort_indexes[sort_key]
+
+    def _sign(self, payload: bytes) -> str:
+        """Return the signature of a cursor payload."""
+        return hmac.new(self.secret, payload,
+                        hashlib.sha256).hexdigest()[:32]
+
+    def encode_cursor(self, sort_key: str, value, position: int) -> str:
+        """Return an opaque cursor pointing after a row."""
+        payload = base64.urlsafe_b64encode(
+            json.dumps([sort_key, value, position]).encode())
+        return "{}.{}".format(payload.decode(), self._sign(payload))
+
+    def decode_cursor(self, cursor: str):
+        """Return the sort key, value and position a cursor points after.
+        """
+        payload, _, signature = cursor.encode().partition(b'.')
+        assert hmac.compare_digest(signature.decode(),
+                                   self._sign(payload)), "Invalid cursor"
+        return json.loads(base64.urlsafe_b64decode(payload))
+
+    def get_by_cursor(self, cursor: str = None, page_size: int = 10,
+                      sort_key: str = 'year') -> Dict:
+        """Get a page of rows in the order of a column.
+
+        Parameters:
+        cursor (str): The next_cursor of the previous page, or None for
+        the first page. A cursor carries its own sort key.
+        page_size (int): The number of items per page.
+        sort_key (str): The column to sort on, for the first page.
+
+        Returns:
+        Dict: A dictionary with the rows and the cursor of the next page,
+        None after the last page.
+        """
+        assert isinstance(page_size, int) and page_size > 0, \
+            "Page size must be a positive integer"
+        start = 0
+        if cursor is not None:
+            sort_key, value, position = self.decode_cursor(cursor)
+        order, values, keys = self.sort_index(sort_key)
+        if cursor is not None:
+            start = bisect_right(keys, (value, position))
+
+        positions = order[start:start + page_size]
+        dataset = self.dataset()
+        next_cursor = None
+        if positions and start + page_size < len(order):
+            last = positions[-1]
+            next_cursor = self.encode_cursor(sort_key, values[last], last)
+        return {
+            'sort_key': sort_key,
+            'page_size': len(positions),
+            'data': [dataset[row] for row in positions],
+            'next_cursor': next_cursor
+        }
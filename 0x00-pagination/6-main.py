@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('6-cursor_pagination').Server
+
+server = Server()
+
+res = server.get_by_cursor(page_size=3, sort_key='count')
+print(res)
+print("---")
+print(server.get_by_cursor(res.get('next_cursor'), 3))
+print("---")
+try:
+    server.get_by_cursor("W" + res.get('next_cursor'), 3)
+except AssertionError:
+    print("AssertionError raised with a tampered cursor")
+
+pages = 0
+cursor = None
+while True:
+    res = server.get_by_cursor(cursor, 1000, 'name')
+    pages += 1
+    cursor = res.get('next_cursor')
+    if cursor is None:
+        break
+print("Pages by name: {}".format(pages))
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Module for filtered hypermedia pagination over secondary indexes.
+
+This module defines a Server that builds secondary indexes over the
+dataset columns, as declared in its INDEXES attribute, and paginates
+the rows matching a set of filters. Matching rows are found by
+intersecting index lookups instead of scanning the dataset, and the
+result of each distinct filter set is cached for the following pages.
+"""
+
+import math
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Dict, List
+
+BaseServer = __import__('2-hypermedia_pagination').Server
+index_range = __import__('2-hypermedia_pagination').index_range
+COLUMNS = __import__('6-cursor_pagination').SORT_KEYS
+
+
+class HashIndex:
+    """Equality index: each value maps to the array of its rows."""
+
+    def __init__(self, values: List):
+        self.rows = {}
+        for row, value in enumerate(values):
+            self.rows.setdefault(value, array('l')).append(row)
+
+    def equal(self, value) -> List[int]:
+        """Return the rows holding a value, in order."""
+        return self.rows.get(value, array('l'))
+
+
+class BitmapIndex:
+    """Equality index for low-cardinality columns.
+
+    Each value maps to a bitmap, stored as an int, with bit i set when
+    row i holds the value. Bitmaps of several filters are intersected
+    with a single AND.
+    """
+
+    def __init__(self, values: List):
+        bitmaps = {}
+        for row, value in enumerate(values):
+            bitmap = bitmaps.get(value)
+            if bitmap is None:
+                bitmap = bitmaps[value] = bytearray((len(values) + 7) // 8)
+            bitmap[row >> 3] |= 1 << (row & 7)
+        self.bitmaps = {value: int.from_bytes(bitmap, 'little')
+                        for value, bitmap in bitmaps.items()}
+
+    def equal(self, value) -> int:
+        """Return the bitmap of the rows holding a value."""
+        return self.bitmaps.get(value, 0)
+
+
+class SortedIndex:
+    """Range and prefix index: rows sorted by value."""
+
+    def __init__(self, values: List):
+        self.order = sorted(range(len(values)), key=values.__getitem__)
+        self.keys = [values[row] for row in self.order]
+
+    def between(self, low, high) -> List[int]:
+        """Return the rows with low <= value <= high, in row order."""
+        start = bisect_left(self.keys, low)
+        end = bisect_right(self.keys, high)
+        return sorted(self.order[start:end])
+
+    def equal(self, value) -> List[int]:
+        """Return the rows holding a value, in order."""
+        return self.between(value, value)
+
+    def prefix(self, prefix: str) -> List[int]:
+        """Return the rows whose value starts with prefix, in order."""
+        start = bisect_left(self.keys, prefix)
+        if prefix:
+            after = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            end = bisect_left(self.keys, after)
+        else:
+            end = len(self.keys)
+        return sorted(self.order[start:end])
+
+
+INDEX_TYPES = {'hash': HashIndex, 'bitmap': BitmapIndex,
+               'sorted': SortedIndex}
+
+
+class Server(BaseServer):
+    """Server class to paginate filtered views of the baby names.
+
+    INDEXES declares the index type of each filterable column.
+    Filters map a column to a value (equality), a (low, high) tuple
+    (inclusive range, sorted indexes only) or {'prefix': text}
+    (sorted indexes only).
+    """
+    INDEXES = {
+        'year': 'bitmap',
+        'gender': 'bitmap',
+        'ethnicity': 'bitmap',
+        'name': 'sorted',
+        'count': 'sorted',
+        'rank': 'hash',
+    }
+    RESULT_CACHE_SIZE = 128
+
+    def __init__(self):
+        super().__init__()
+        self.__indexes = None
+        self.__results = OrderedDict()
+
+    def indexes(self) -> Dict:
+        """Cached secondary indexes, by column name."""
+        if self.__indexes is None:
+            dataset = self.dataset()
+            self.__indexes = {}
+            for name, kind in self.INDEXES.items():
+                column, cast = COLUMNS[name]
+                values = [cast(row[column]) for row in dataset]
+                self.__indexes[name] = INDEX_TYPES[kind](values)
+        return self.__indexes
+
+    def _lookup(self, name: str, condition):
+        """Return the rows matching one filter, as a list or a bitmap."""
+        assert name in self.INDEXES, "No index on {}".format(name)
+        index = self.indexes()[name]
+        cast = COLUMNS[name][1]
+        if isinstance(condition, dict):
+            assert isinstance(index, SortedIndex), \
+                "Prefix filters need a sorted index"
+            return index.prefix(condition['prefix'])
+        if isinstance(condition, tuple):
+            assert isinstance(index, SortedIndex), \
+                "Range filters need a sorted index"
+            return index.between(cast(condition[0]), cast(condition[1]))
+        return index.equal(cast(condition))
+
+    def filtered_rows(self, filters: Dict) -> List[int]:
+        """Return the positions of the rows matching every filter.
+
+        Parameters:
+        filters (Dict): The filters, by column name.
+
+        Returns:
+        List[int]: The matching row positions, in dataset order.
+        """
+        key = tuple(sorted((name, repr(condition))
+                           for name, condition in filters.items()))
+        if key in self.__results:
+            self.__results.move_to_end(key)
+            return self.__results[key]
+
+        lists, bitmap = [], None
+        for name, condition in filters.items():
+            rows = self._lookup(name, condition)
+            if isinstance(rows, int):
+                bitmap = rows if bitmap is None else bitmap & rows
+            else:
+                lists.append(rows)
+
+        size = (len(self.dataset()) + 7) // 8
+        bits = bitmap.to_bytes(size, 'little') if bitmap is not None else b''
+        if lists:
+            # Filter the smallest list by the other lists and the bitmap
+            lists.sort(key=len)
+            others = [set(rows) for rows in lists[1:]]
+            result = [row for row in lists[0]
+                      if all(row in rows for rows in others) and
+                      (bitmap is None or bits[row >> 3] >> (row & 7) & 1)]
+        else:
+            result = [match.start() * 8 + bit
+                      for match in re.finditer(b'[^\x00]', bits)
+                      for bit in range(8) if match.group()[0] >> bit & 1]
+
+        self.__results[key] = result
+        if len(self.__results) > self.RESULT_CACHE_SIZE:
+            self.__results.popitem(last=False)
+        return result
+
+    def get_hyper(self, page: int = 1, page_size: int = 10,
+                  filters: Dict = None) -> dict:
+        """Get a hyper pagination dictionary of the filtered rows.
+
+        Parameters:
+        page (int): The page number (1-indexed).
+        page_size (int): The number of items per page.
+        filters (Dict): The filters, by column name, or None for all rows.
+
+        Returns:
+        dict: A dictionary containing pagination details.
+        """
+        if not filters:
+            return super().get_hyper(page, page_size)
+        assert isinstance(page, int) and page > 0, \
+            "Page must be a positive integer"
+        assert isinstance(page_size, int) and page_size > 0, \
+            "Page size must be a positive integer"
+
+        rows = self.filtered_rows(filters)
+        start_index, end_index = index_range(page, page_size)
+        dataset = self.dataset()
+        data = [dataset[row] for row in rows[start_index:end_index]]
+        total_pages = math.ceil(len(rows) / page_size)
+
+        return {
+            'page_size': len(data),
+            'page': page,
+            'data': data,
+            'next_page': page + 1 if page < total_pages else None,
+            'prev_page': page - 1 if page > 1 else None,
+            'total_pages': total_pages
+        }
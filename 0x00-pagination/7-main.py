@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('7-filtered_pagination').Server
+
+server = Server()
+
+print(server.get_hyper(1, 2, filters={'year': 2016, 'gender': 'FEMALE'}))
+print("---")
+print(server.get_hyper(2, 3, filters={'name': {'prefix': 'Ol'},
+                                       'ethnicity': 'HISPANIC'}))
+print("---")
+print(server.get_hyper(1, 2, filters={'count': (100, 120), 'rank': 1}))
+print("---")
+print(server.get_hyper(1, 2))
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark of parallel CSV loading against core count
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+loader = __import__('8-parallel_loader')
+
+
+def make_csv(path: str, rows: int) -> None:
+    """Write a synthetic baby names file of `rows` rows."""
+    rand = random.Random(0)
+    ethnicities = ["ASIAN AND PACIFIC ISLANDER", "BLACK NON HISPANIC",
+                   "HISPANIC", "WHITE NON HISPANIC"]
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Year of Birth", "Gender", "Ethnicity",
+                         "Child's First Name", "Count", "Rank"])
+        for _ in range(rows):
+            writer.writerow([rand.randint(2011, 2016),
+                             rand.choice(["FEMALE", "MALE"]),
+                             rand.choice(ethnicities),
+                             "Name{}".format(rand.randrange(2000)),
+                             rand.randint(10, 300), rand.randint(1, 100)])
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    path = os.path.join(tempfile.mkdtemp(), "names.csv")
+    make_csv(path, rows)
+    print("{} rows, {} bytes".format(rows, os.path.getsize(path)))
+
+    start = time.perf_counter()
+    expected = loader.serial_load(path)
+    serial = time.perf_counter() - start
+    print("{:>8} {:>10} {:>8}".format("workers", "seconds", "speedup"))
+    print("{:>8} {:>10.2f} {:>8.2f}".format("serial", serial, 1))
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        rows_read = loader.parallel_load(path, workers)
+        elapsed = time.perf_counter() - start
+        assert rows_read == expected
+        print("{:>8} {:>10.2f} {:>8.2f}".format(
+            workers, elapsed, serial / elapsed))
+        workers *= 2
+    os.remove(path)
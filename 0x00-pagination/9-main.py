@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+Server = __import__('9-reloading_server').Server
+
+path = os.path.join(tempfile.mkdtemp(), "names.csv")
+shutil.copy(Server.DATA_FILE, path)
+
+server = Server()
+server.DATA_FILE = path
+server.watch(0.05)
+
+res = server.get_hyper(1, 2)
+print(res.get('version'), res.get('total_pages'))
+print(server.get_hyper_index(0, 2))
+
+with open(path, 'a') as f:
+    f.write("2017,FEMALE,HISPANIC,Ada,10,1\n2017,MALE,HISPANIC,Bob,9,2\n")
+time.sleep(0.2)
+res = server.get_hyper(1, 2)
+print(res.get('version'), res.get('total_pages'))
+print(server.get_page(len(server.dataset()) // 2, 2))
+
+with open(path, 'w') as f:
+    f.write("Year of Birth,Gender,Ethnicity,Child's First Name,Count,Rank\n")
+    f.write("2018,FEMALE,HISPANIC,Eve,11,1\n")
+time.sleep(0.2)
+print(server.get_hyper(1, 2))
+server.stop_watching()
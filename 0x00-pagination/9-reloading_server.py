@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Module for paginating a dataset that is reloaded while being served.
+
+This module defines a Server that keeps the dataset and its index in
+an immutable snapshot. A background thread watches DATA_FILE, builds a
+new snapshot when the file changes and swaps it in with a single
+assignment, so every call works on one consistent snapshot. When the
+file only grew at the end, which is checked against a hash of the bytes
+already loaded, only the appended rows are parsed.
+"""
+
+import csv
+import hashlib
+import io
+import math
+import os
+import threading
+import traceback
+from typing import Dict, List
+
+BaseServer = __import__('3-hypermedia_del_pagination').Server
+IndexedDataset = __import__('3-hypermedia_del_pagination').IndexedDataset
+index_range = __import__('2-hypermedia_pagination').index_range
+
+CHUNK_SIZE = 1 << 20  # Bytes hashed at a time when checking a prefix
+
+
+class Snapshot:
+    """Dataset and index built from one version of the data file."""
+
+    def __init__(self, version: int, dataset: List[List],
+                 indexed_dataset: IndexedDataset, size: int,
+                 mtime_ns: int, digest: bytes, tail: bytes):
+        self.version = version
+        self.dataset = dataset
+        self.indexed_dataset = indexed_dataset
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.digest = digest  # Hash of the `size` bytes loaded
+        self.tail = tail  # Last byte loaded
+
+
+class Server(BaseServer):
+    """Server class to paginate a hot-reloaded database of baby names."""
+
+    def __init__(self):
+        super().__init__()
+        self.__snapshot = None
+        self.__reload_lock = threading.Lock()
+        self.__watcher = None
+
+    def snapshot(self) -> Snapshot:
+        """Current snapshot, loaded on first use."""
+        if self.__snapshot is None:
+            self.reload()
+        return self.__snapshot
+
+    def dataset(self) -> List[List]:
+        """Dataset of the current snapshot."""
+        return self.snapshot().dataset
+
+    def indexed_dataset(self) -> Dict[int, List]:
+        """Indexed dataset of the current snapshot."""
+        return self.snapshot().indexed_dataset
+
+    def reload(self) -> bool:
+        """Load DATA_FILE again if it changed since the last snapshot.
+
+        Returns:
+        bool: True if a new snapshot was swapped in.
+        """
+        with self.__reload_lock:
+            old = self.__snapshot
+            stat = os.stat(self.DATA_FILE)
+            if old is not None and (stat.st_size, stat.st_mtime_ns) == \
+                    (old.size, old.mtime_ns):
+                return False
+            version = old.version + 1 if old is not None else 1
+
+            appended = None
+            with open(self.DATA_FILE, 'rb') as f:
+                if old is not None and stat.st_size >= old.size and \
+                        old.tail == b'\n':
+                    hasher = self._hash_prefix(f, old.size)
+                    if hasher.digest() == old.digest:
+                        appended = f.read()
+                    else:
+                        f.seek(0)
+                if appended is None:
+                    data = f.read()
+                    hasher = hashlib.blake2b(data)
+                    size, tail = len(data), data[-1:]
+
+            if appended == b'':
+                # Touched but unchanged: keep the snapshot and its version
+                self.__snapshot = Snapshot(
+                    old.version, old.dataset, old.indexed_dataset, old.size,
+                    stat.st_mtime_ns, old.digest, old.tail)
+                return False
+            if appended is not None:
+                # A last row still being written is left for the next
+                # reload: size and digest stop at the last complete line
+                appended = appended[:appended.rfind(b'\n') + 1]
+                if not appended:
+                    return False
+                hasher.update(appended)
+                size, tail = old.size + len(appended), b'\n'
+                # Appended rows only: keep the rows and deletions we have
+                rows = self._parse(appended)
+                dataset = old.dataset + rows
+                indexed_dataset = old.indexed_dataset.copy()
+                indexed_dataset.extend(rows, len(old.dataset))
+            else:
+                dataset = self._parse(data)[1:]  # Skip the header row
+                indexed_dataset = IndexedDataset(dataset)
+
+            self.__snapshot = Snapshot(version, dataset, indexed_dataset,
+                                       size, stat.st_mtime_ns,
+                                       hasher.digest(), tail)
+            return True
+
+    @staticmethod
+    def _hash_prefix(f, size: int):
+        """Hash the first `size` bytes of an open file."""
+        hasher = hashlib.blake2b()
+        while size > 0:
+            chunk = f.read(min(CHUNK_SIZE, size))
+            if not chunk:
+                break
+            hasher.update(chunk)
+            size -= len(chunk)
+        return hasher
+
+    def delete_row(self, index: int) -> None:
+        """Delete the row at an index of the current snapshot.
+
+        Runs under the reload lock, so a reload copying the deletions
+        of the snapshot cannot miss it.
+        """
+        self.snapshot()  # Load outside the lock, reload() takes it
+        with self.__reload_lock:
+            del self.__snapshot.indexed_dataset[index]
+
+    def insert_row(self, index: int, row: List) -> None:
+        """Insert or replace the row at an index of the current snapshot.
+        """
+        self.snapshot()
+        with self.__reload_lock:
+            self.__snapshot.indexed_dataset[index] = row
+
+    @staticmethod
+    def _parse(data: bytes) -> List[List]:
+        """Parse CSV bytes into rows."""
+        return list(csv.reader(io.StringIO(data.decode(), newline='')))
+
+    def watch(self, interval: float = 1.0) -> None:
+        """Check DATA_FILE every `interval` seconds in a daemon thread."""
+        if self.__watcher is not None:
+            return
+        stop = threading.Event()
+
+        def run():
+            """Reload until stopped."""
+            while not stop.wait(interval):
+                try:
+                    self.reload()
+                except (OSError, UnicodeDecodeError, csv.Error):
+                    pass  # The file is being replaced, retry next time
+                except Exception:
+                    traceback.print_exc()  # Report it, keep watching
+
+        self.__watcher = (threading.Thread(target=run, daemon=True), stop)
+        self.__watcher[0].start()
+
+    def stop_watching(self) -> None:
+        """Stop the watcher thread."""
+        if self.__watcher is not None:
+            thread, stop = self.__watcher
+            stop.set()
+            thread.join()
+            self.__watcher = None
+
+    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+        """Get a page of the current dataset.
+
+        Parameters:
+        page (int): The page number (1-indexed).
+        page_size (int): The number of items per page.
+
+        Returns:
+        List[List]: A list of rows for the specified page.
+        """
+        assert isinstance(page, int) and page > 0, \
+            "Page must be a positive integer"
+        assert isinstance(page_size, int) and page_size > 0, \
+            "Page size must be a positive integer"
+        start_index, end_index = index_range(page, page_size)
+        return self.dataset()[start_index:end_index]
+
+    def get_hyper(self, page: int = 1, page_size: int = 10) -> dict:
+        """Get a hyper pagination dictionary from a single snapshot.
+
+        Parameters:
+        page (int): The page number (1-indexed).
+        page_size (int): The number of items per page.
+
+        Returns:
+        dict: A dictionary containing pagination details and the
+        version of the snapshot it was built from.
+        """
+        assert isinstance(page, int) and page > 0, \
+            "Page must be a positive integer"
+        assert isinstance(page_size, int) and page_size > 0, \
+            "Page size must be a positive integer"
+        snapshot = self.snapshot()
+        start_index, end_index = index_range(page, page_size)
+        data = snapshot.dataset[start_index:end_index]
+        total_pages = math.ceil(len(snapshot.dataset) / page_size)
+        return {
+            'page_size': len(data),
+            'page': page,
+            'data': data,
+            'next_page': page + 1 if page < total_pages else None,
+            'prev_page': page - 1 if page > 1 else None,
+            'total_pages': total_pages,
+            'version': snapshot.version
+        }
@@ -6,14 +6,4 @@ from base_caching import BaseCaching
 
 class BasicCache(BaseCaching):
     """ BasicCache provides a caching system without limits """
-
-    def put(self, key, item):
-        """ Add an item in the cache """
-        if key is not None and item is not None:
-            self.cache_data[key] = item
-
-    def get(self, key):
-        """ Get an item by key """
-        if key is None or key not in self.cache_data:
-            return None
-        return self.cache_data[key]
+    MAX_ITEMS = None
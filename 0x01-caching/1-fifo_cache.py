@@ -1,33 +1,26 @@
 #!/usr/bin/python3
 """ FIFOCache module
 """
-from collections import deque
+from collections import OrderedDict
 from base_caching import BaseCaching
 
 
 class FIFOCache(BaseCaching):
     """ FIFOCache provides a caching system using FIFO algorithm """
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """ Initialize the cache and the order of keys """
-        super().__init__()
-        self.order = deque()
+        super().__init__(*args, **kwargs)
+        self.order = OrderedDict()  # Keys in insertion order
 
-    def put(self, key, item):
-        """ Add an item in the cache """
-        if key is not None and item is not None:
-            if key not in self.cache_data:
-                self.order.append(key)  # Keep track of the insertion order
+    def _track(self, key):
+        """ Keep track of the insertion order """
+        self.order[key] = None
 
-            self.cache_data[key] = item
+    def _untrack(self, key):
+        """ Forget a removed key """
+        del self.order[key]
 
-            if len(self.cache_data) > BaseCaching.MAX_ITEMS:
-                oldest_key = self.order.popleft()  # Get the first item (FIFO)
-                del self.cache_data[oldest_key]  # Remove it from the cache
-                print("DISCARD: {}".format(oldest_key))
-
-    def get(self, key):
-        """ Get an item by key """
-        if key is None or key not in self.cache_data:
-            return None
-        return self.cache_data[key]
+    def _victim(self):
+        """ The first inserted key (FIFO) """
+        return next(iter(self.order))
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+""" 100-bench: per-operation latency of LFUCache from 1e3 to 1e6 keys """
+import random
+import time
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+OPS = 100000
+
+
+def bench(size):
+    """ Fill a cache of `size` keys, then time mixed get/put/evict ops """
+    cache = LFUCache(max_items=size, on_evict=[])
+    for i in range(size):
+        cache.put(i, i)
+    hits = [random.randrange(size) for _ in range(OPS)]
+    start = time.perf_counter()
+    for k in hits:
+        cache.get(k)
+    get_ns = (time.perf_counter() - start) / OPS * 1e9
+    start = time.perf_counter()
+    for k in range(size, size + OPS):
+        cache.put(k, k)  # Every put of a new key evicts one
+    put_ns = (time.perf_counter() - start) / OPS * 1e9
+    return get_ns, put_ns
+
+
+if __name__ == "__main__":
+    print("{:>9} {:>12} {:>16}".format("keys", "get ns/op", "put+evict ns/op"))
+    for size in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+        get_ns, put_ns = bench(size)
+        print("{:>9} {:>12.0f} {:>16.0f}".format(size, get_ns, put_ns))
@@ -1,59 +1,83 @@
 #!/usr/bin/env python3
 """ LFUCache module
 """
+from collections import OrderedDict
 from base_caching import BaseCaching
 
 
 class LFUCache(BaseCaching):
-    """ LFUCache provides a caching system using LFU algorithm """
+    """ LFUCache provides a caching system using LFU algorithm
 
-    def __init__(self):
+    Keys are grouped in buckets by access frequency. Each bucket is an
+    OrderedDict kept in LRU order, and the frequencies of the non-empty
+    buckets are linked in increasing order, so `min_freq` is always the
+    head of that list and get, put, eviction and removal all run in
+    O(1).
+    """
+
+    def __init__(self, *args, **kwargs):
         """ Initialize the cache """
-        super().__init__()
+        super().__init__(*args, **kwargs)
         self.frequency = {}  # Dictionary to keep track of access frequencies
-        self.order = []      # List to keep LRU access order in same frequency
-
-    def put(self, key, item):
-        """ Add an item in the cache """
-        if key is None or item is None:
-            return
-
-        if key in self.cache_data:
-            # Update the existing item
-            self.cache_data[key] = item
-            self.frequency[key] += 1  # Increase frequency
-            self.order.remove(key)     # Remove the key from order
-            self.order.append(key)      # Append it to the end for LRU
-            return
-
-        # If the cache is full, we must remove an item
-        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            # Find the least frequently used items
-            min_freq = min(self.frequency.values())
-            # Get candidates with the minimum frequency
-            candidates = \
-                [k for k, v in self.frequency.items() if v == min_freq]
-
-            if candidates:
-                # Among the candidates, find the least recently used
-                lru_key = self.order[self.order.index(candidates[0])]
-                del self.cache_data[lru_key]  # Remove from cache
-                del self.frequency[lru_key]    # Remove frequency tracking
-                self.order.remove(lru_key)      # Update order
-                print("DISCARD: {}".format(lru_key))
-
-        # Add the new key-value pair to cache
-        self.cache_data[key] = item
-        self.frequency[key] = 1  # New item frequency
-        self.order.append(key)    # Track access order
-
-    def get(self, key):
-        """ Retrieve an item by key """
-        if key is None or key not in self.cache_data:
-            return None
-
-        # Update the frequency and order
-        self.frequency[key] += 1  # Increase frequency
-        self.order.remove(key)     # Remove key from the order
-        self.order.append(key)      # Append it to the end for LRU
-        return self.cache_data[key]
+        self.buckets = {}    # Frequency -> keys of that frequency, LRU first
+        self.next_freq = {}  # Frequency -> next higher non-empty frequency
+        self.prev_freq = {}  # Frequency -> next lower non-empty frequency
+        self.min_freq = 0    # Lowest frequency currently in the cache
+
+    def _link_bucket(self, freq, prev):
+        """ Add an empty bucket for freq after the prev frequency """
+        nxt = self.min_freq if prev is None else self.next_freq[prev]
+        if nxt == 0:
+            nxt = None
+        self.buckets[freq] = OrderedDict()
+        self.prev_freq[freq] = prev
+        self.next_freq[freq] = nxt
+        if prev is None:
+            self.min_freq = freq
+        else:
+            self.next_freq[prev] = freq
+        if nxt is not None:
+            self.prev_freq[nxt] = freq
+
+    def _unlink_bucket(self, freq):
+        """ Drop the bucket of freq once it is empty """
+        del self.buckets[freq]
+        prev = self.prev_freq.pop(freq)
+        nxt = self.next_freq.pop(freq)
+        if prev is None:
+            self.min_freq = 0 if nxt is None else nxt
+        else:
+            self.next_freq[prev] = nxt
+        if nxt is not None:
+            self.prev_freq[nxt] = prev
+
+    def _track(self, key):
+        """ A new key starts with a frequency of 1 """
+        self.frequency[key] = 1
+        if 1 not in self.buckets:
+            self._link_bucket(1, None)
+        self.buckets[1][key] = None
+
+    def _untrack(self, key):
+        """ Remove a key from its frequency bucket """
+        freq = self.frequency.pop(key)
+        bucket = self.buckets[freq]
+        del bucket[key]
+        if not bucket:
+            self._unlink_bucket(freq)
+
+    def _on_access(self, key):
+        """ Move a key from its frequency bucket to the next one """
+        freq = self.frequency[key]
+        if freq + 1 not in self.buckets:
+            self._link_bucket(freq + 1, freq)
+        bucket = self.buckets[freq]
+        del bucket[key]
+        if not bucket:
+            self._unlink_bucket(freq)
+        self.frequency[key] = freq + 1
+        self.buckets[freq + 1][key] = None
+
+    def _victim(self):
+        """ Least recently used key of the least frequency bucket """
+        return next(iter(self.buckets[self.min_freq]))
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+""" 101-bench: LockedCache vs ShardedCache throughput under contention """
+import random
+import threading
+import time
+LRUCache = __import__('3-lru_cache').LRUCache
+thread_safe = __import__('101-thread_safe_cache')
+LockedCache = thread_safe.LockedCache
+ShardedCache = thread_safe.ShardedCache
+
+OPS = 200000
+KEYS = 50000
+
+
+def run(cache, threads):
+    """ Split OPS mixed get/put operations across `threads` threads """
+    per_thread = OPS // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        keys = [random.randrange(KEYS) for _ in range(per_thread)]
+        barrier.wait()
+        for k in keys:
+            if cache.get(k) is None:
+                cache.put(k, k)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print("{:>8} {:>16} {:>16}".format(
+        "threads", "locked ops/s", "sharded ops/s"))
+    for threads in (1, 4, 16, 64):
+        locked = LockedCache(LRUCache(max_items=KEYS // 2, on_evict=[]))
+        sharded = ShardedCache(LRUCache, max_items=KEYS // 2, on_evict=[])
+        locked, sharded = run(locked, threads), run(sharded, threads)
+        print("{:>8} {:>16.0f} {:>16.0f}".format(threads, locked, sharded))
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+""" 101-main """
+import threading
+LRUCache = __import__('3-lru_cache').LRUCache
+thread_safe = __import__('101-thread_safe_cache')
+LockedCache = thread_safe.LockedCache
+ShardedCache = thread_safe.ShardedCache
+
+
+def worker(cache, name):
+    """ Write then read back a few keys """
+    for i in range(3):
+        cache.put("{}{}".format(name, i), i)
+        cache.get("{}{}".format(name, i))
+
+
+my_cache = LockedCache(LRUCache(max_items=12))
+threads = [threading.Thread(target=worker, args=(my_cache, name))
+           for name in "ABCD"]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+my_cache.print_cache()
+
+my_cache = ShardedCache(LRUCache, shards=4, max_items=64)
+threads = [threading.Thread(target=worker, args=(my_cache, name))
+           for name in "ABCD"]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+my_cache.print_cache()
+print(my_cache.get("A1"))
+print(my_cache.get("Z1"))
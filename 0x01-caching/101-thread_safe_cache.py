@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+""" Thread-safe caches module
+"""
+import threading
+
+
+class LockedCache():
+    """ LockedCache serializes every operation of a wrapped cache
+
+    Any BaseCaching subclass can be wrapped. Reads take the lock too,
+    since policies such as LRU and LFU reorder their keys on get.
+    """
+
+    def __init__(self, cache):
+        """ Wrap an existing cache instance """
+        self.cache = cache
+        self.lock = threading.RLock()
+
+    @property
+    def cache_data(self):
+        """ The wrapped cache's data """
+        return self.cache.cache_data
+
+    def put(self, key, item, ttl=None):
+        """ Add an item in the cache """
+        with self.lock:
+            self.cache.put(key, item, ttl)
+
+    def get(self, key):
+        """ Get an item by key """
+        with self.lock:
+            return self.cache.get(key)
+
+    def put_many(self, mapping, ttl=None):
+        """ Add several items in the cache, under one lock acquisition """
+        with self.lock:
+            self.cache.put_many(mapping, ttl)
+
+    def get_many(self, keys):
+        """ Get the hits among several keys, under one lock acquisition """
+        with self.lock:
+            return self.cache.get_many(keys)
+
+    def print_cache(self):
+        """ Print the cache """
+        with self.lock:
+            self.cache.print_cache()
+
+    def stats(self):
+        """ Counters and current size of the wrapped cache """
+        with self.lock:
+            return self.cache.stats()
+
+    def start_reaper(self, interval=1.0):
+        """ Reap expired entries in a thread, under the lock """
+        self.cache.start_reaper(interval, self.lock)
+
+    def stop_reaper(self):
+        """ Stop the background reaper """
+        self.cache.stop_reaper()
+
+
+class ShardedCache():
+    """ ShardedCache spreads keys over independently locked shards
+
+    Each shard is a LockedCache around its own `policy` instance, so
+    threads working on different shards never wait on the same lock.
+    The max_items and max_bytes limits are divided between shards, the
+    first shards taking one more when they do not divide evenly, so the
+    shard limits sum to the requested ones. A limit below `shards`
+    would leave a shard with none, so it is a ValueError.
+    """
+
+    def __init__(self, policy, shards=16, max_items=None, max_bytes=None,
+                 **kwargs):
+        """ Create `shards` caches of the given policy class """
+        if max_items is None:
+            max_items = policy.MAX_ITEMS
+        items = self._split(max_items, shards, "max_items")
+        sizes = self._split(max_bytes, shards, "max_bytes")
+        self.shards = [
+            LockedCache(policy(max_items=items[i], max_bytes=sizes[i],
+                               **kwargs))
+            for i in range(shards)
+        ]
+
+    @staticmethod
+    def _split(limit, shards, name):
+        """ Per-shard limits summing to `limit`, or Nones if unbounded """
+        if limit is None:
+            return [None] * shards
+        if limit < shards:
+            raise ValueError("{} must be at least the number of shards"
+                             .format(name))
+        share, extra = divmod(limit, shards)
+        return [share + (i < extra) for i in range(shards)]
+
+    def shard(self, key):
+        """ The shard owning a key """
+        return self.shards[hash(key) % len(self.shards)]
+
+    @property
+    def cache_data(self):
+        """ A merged snapshot of every shard's data """
+        data = {}
+        for shard in self.shards:
+            with shard.lock:
+                data.update(shard.cache_data)
+        return data
+
+    def put(self, key, item, ttl=None):
+        """ Add an item in the cache """
+        if key is not None:
+            self.shard(key).put(key, item, ttl)
+
+    def get(self, key):
+        """ Get an item by key """
+        if key is None:
+            return None
+        return self.shard(key).get(key)
+
+    def put_many(self, mapping, ttl=None):
+        """ Add several items in the cache, one batch per shard """
+        batches = {}
+        for key, item in mapping.items():
+            if key is not None:
+                batches.setdefault(self.shard(key), {})[key] = item
+        for shard, batch in batches.items():
+            shard.put_many(batch, ttl)
+
+    def get_many(self, keys):
+        """ Get the hits among several keys, one batch per shard """
+        batches = {}
+        for key in keys:
+            if key is not None:
+                batches.setdefault(self.shard(key), []).append(key)
+        found = {}
+        for shard, batch in batches.items():
+            found.update(shard.get_many(batch))
+        return found
+
+    def print_cache(self):
+        """ Print the cache """
+        data = self.cache_data
+        print("Current cache:")
+        for key in sorted(data.keys()):
+            print("{}: {}".format(key, data.get(key)))
+
+    def stats(self):
+        """ Counters and current size summed over every shard """
+        total = {}
+        for shard in self.shards:
+            for name, value in shard.stats().items():
+                if name in ("policy", "hit_ratio"):
+                    continue
+                if value is None:  # Not measured, e.g. bytes
+                    total.setdefault(name, None)
+                else:
+                    total[name] = (total.get(name) or 0) + value
+        lookups = total["hits"] + total["misses"]
+        total["hit_ratio"] = total["hits"] / lookups if lookups else 0.0
+        total["policy"] = type(self.shards[0].cache).__name__
+        return total
+
+    def start_reaper(self, interval=1.0):
+        """ Reap expired entries of every shard in background threads """
+        for shard in self.shards:
+            shard.start_reaper(interval)
+
+    def stop_reaper(self):
+        """ Stop the background reapers """
+        for shard in self.shards:
+            shard.stop_reaper()
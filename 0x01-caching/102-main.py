@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+""" 102-main """
+import threading
+import time
+cached = __import__('102-memoize').cached
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+
+@cached(max_items=2)
+def square(x):
+    """ Slow square """
+    time.sleep(0.1)
+    return x * x
+
+
+print(square(2))
+print(square(2))
+print(square(3))
+print(square(x=3))
+print(square.cache_info())
+
+
+@cached(policy=LFUCache, ttl=0.2)
+def lookup(name):
+    """ Slow lookup, counting how many times it really runs """
+    lookup.calls += 1
+    time.sleep(0.1)
+    return name.upper()
+
+
+lookup.calls = 0
+threads = [threading.Thread(target=lookup, args=("holberton",))
+           for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(lookup("holberton"), lookup.calls)
+time.sleep(0.3)
+print(lookup("holberton"), lookup.calls)
+print(lookup.cache_info())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+""" Memoization module
+"""
+import functools
+import threading
+LRUCache = __import__('3-lru_cache').LRUCache
+
+_KWARGS_MARK = object()  # Separates positional from keyword arguments
+
+
+def make_key(args, kwargs):
+    """ Build a hashable cache key from call arguments """
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    return key
+
+
+def cached(policy=LRUCache, max_items=128, ttl=None, **kwargs):
+    """ Memoize a function through a BaseCaching policy
+
+    policy is any BaseCaching subclass, built with max_items, ttl and
+    any extra keyword arguments (max_bytes, sizer, on_evict which
+    defaults to no callback). max_items defaults to 128 results, as
+    functools.lru_cache does, rather than the policy's MAX_ITEMS.
+    Results older than ttl seconds are recomputed. Concurrent calls
+    missing on the same key wait for a single computation instead of
+    running the function again.
+
+    The decorated function exposes `cache` and `cache_info()`.
+    """
+    kwargs.setdefault("on_evict", [])
+
+    def decorator(func):
+        """ Wrap func with its own cache """
+        cache = policy(max_items=max_items, ttl=ttl, **kwargs)
+        lock = threading.Lock()
+        in_flight = {}  # Key -> Event set once its computation ends
+        info = {"hits": 0, "misses": 0}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kw):
+            """ Return the cached result or compute it once """
+            key = make_key(args, kw)
+            while True:
+                with lock:
+                    entry = cache.get(key)
+                    if entry is not None:
+                        info["hits"] += 1
+                        return entry[0]
+                    event = in_flight.get(key)
+                    if event is None:
+                        # This call computes, the others wait for it
+                        event = in_flight[key] = threading.Event()
+                        info["misses"] += 1
+                        break
+                event.wait()
+
+            try:
+                value = func(*args, **kw)
+                with lock:
+                    cache.put(key, (value,))  # Boxed so None is cached too
+            finally:
+                with lock:
+                    del in_flight[key]
+                event.set()
+            return value
+
+        def cache_info():
+            """ Hit and miss counters and the current cache size """
+            with lock:
+                return dict(info, size=len(cache.cache_data))
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache_info
+        return wrapper
+    return decorator
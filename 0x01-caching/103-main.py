@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+""" 103-main """
+exporter = __import__('103-stats_exporter')
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+evicted = []
+lru = LRUCache(on_evict=[lambda key, item: evicted.append(key)])
+lfu = LFUCache()
+for cache in (lru, lfu):
+    for key in "ABCDE":
+        cache.put(key, key.lower())
+    cache.get("E")
+    cache.get("A")
+print(evicted)
+print(lru.stats())
+print(exporter.to_json({"lru": lru, "lfu": lfu}))
+print(exporter.to_prometheus({"lru": lru, "lfu": lfu}), end="")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+""" Cache statistics exporter module
+"""
+import json
+
+COUNTERS = ("hits", "misses", "insertions", "evictions", "expirations")
+GAUGES = ("hit_ratio", "size", "bytes")
+
+
+def to_json(caches):
+    """ Serialize the stats of named caches, {name: cache}, as JSON """
+    return json.dumps({name: cache.stats() for name, cache in caches.items()},
+                      sort_keys=True)
+
+
+def to_prometheus(caches, prefix="cache"):
+    """ Render the stats of named caches in Prometheus text format """
+    stats = {name: cache.stats() for name, cache in caches.items()}
+    lines = []
+    for metric, kind in [(m, "counter") for m in COUNTERS] + \
+            [(m, "gauge") for m in GAUGES]:
+        # Stats a cache does not measure (None) are left out
+        names = [name for name in sorted(stats)
+                 if stats[name].get(metric) is not None]
+        if not names:
+            continue
+        full_name = "{}_{}{}".format(
+            prefix, metric, "_total" if kind == "counter" else "")
+        lines.append("# TYPE {} {}".format(full_name, kind))
+        for name in names:
+            lines.append('{}{{cache="{}",policy="{}"}} {}'.format(
+                full_name, name, stats[name]["policy"],
+                stats[name][metric]))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+""" ARCCache module
+"""
+from collections import OrderedDict
+from base_caching import BaseCaching
+
+
+class ARCCache(BaseCaching):
+    """ ARCCache provides a caching system using the Adaptive Replacement
+    Cache algorithm
+
+    Keys seen once live in `t1`, keys seen again in `t2`. The ghost lists
+    `b1` and `b2` remember keys recently evicted from each side, and a
+    hit on a ghost moves the target size `p` of `t1` towards the side
+    that would have kept it. A long scan only churns `t1`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """ Initialize the cache """
+        super().__init__(*args, **kwargs)
+        self.t1 = OrderedDict()  # Recent keys, LRU first
+        self.t2 = OrderedDict()  # Frequent keys, LRU first
+        self.b1 = OrderedDict()  # Ghosts evicted from t1
+        self.b2 = OrderedDict()  # Ghosts evicted from t2
+        self.p = 0               # Target size of t1
+        self.incoming = None     # Key being inserted, used by _victim
+
+    def _admit(self, keys):
+        """ Adapt p for every ghost about to come back """
+        capacity = self.max_items or len(self.cache_data) + len(keys)
+        self.incoming = None
+        for key in keys:
+            if key in self.b1:
+                delta = max(1, len(self.b2) // len(self.b1))
+                self.p = min(capacity, self.p + delta)
+            elif key in self.b2:
+                delta = max(1, len(self.b1) // len(self.b2))
+                self.p = max(0, self.p - delta)
+                self.incoming = key
+        if self.incoming is None and keys:
+            self.incoming = keys[0]
+
+    def _track(self, key):
+        """ Ghost hits go to t2, brand new keys to t1 """
+        if key in self.b1:
+            del self.b1[key]
+            self.t2[key] = None
+        elif key in self.b2:
+            del self.b2[key]
+            self.t2[key] = None
+        else:
+            self.t1[key] = None
+        # Keep the ghost directories bounded by the capacity
+        capacity = self.max_items or len(self.cache_data)
+        while self.b1 and len(self.t1) + len(self.b1) > capacity:
+            self.b1.popitem(last=False)
+        while self.b2 and len(self.t1) + len(self.t2) + len(self.b1) + \
+                len(self.b2) > 2 * capacity:
+            self.b2.popitem(last=False)
+
+    def _untrack(self, key):
+        """ Removed keys are remembered in the matching ghost list """
+        if key in self.t1:
+            del self.t1[key]
+            self.b1[key] = None
+        else:
+            del self.t2[key]
+            self.b2[key] = None
+
+    def _on_access(self, key):
+        """ A key used again becomes the most recent of t2 """
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        else:
+            self.t2.move_to_end(key)
+
+    def _victim(self):
+        """ LRU of t1 when t1 is over its target, else LRU of t2 """
+        if self.t1 and (len(self.t1) > self.p or not self.t2 or
+                        (self.incoming in self.b2 and
+                         len(self.t1) == self.p)):
+            return next(iter(self.t1))
+        return next(iter(self.t2))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+""" TwoQueueCache module
+"""
+from collections import OrderedDict
+from base_caching import BaseCaching
+
+
+class TwoQueueCache(BaseCaching):
+    """ TwoQueueCache provides a caching system using the 2Q algorithm
+
+    New keys enter the FIFO `a1in`. Keys evicted from it are remembered
+    in the ghost FIFO `a1out`, and only a key seen again while it is a
+    ghost is admitted to the LRU `am`. One-time scans never reach `am`.
+    """
+    KIN = 0.25   # Share of the capacity kept for a1in
+    KOUT = 0.5   # Number of ghosts, relative to the capacity
+
+    def __init__(self, *args, **kwargs):
+        """ Initialize the cache """
+        super().__init__(*args, **kwargs)
+        self.a1in = OrderedDict()   # Keys seen once, FIFO
+        self.a1out = OrderedDict()  # Ghosts evicted from a1in, FIFO
+        self.am = OrderedDict()     # Keys seen again, LRU first
+
+    def _track(self, key):
+        """ Ghosts seen again go to am, new keys to a1in """
+        if key in self.a1out:
+            del self.a1out[key]
+            self.am[key] = None
+        else:
+            self.a1in[key] = None
+
+    def _untrack(self, key):
+        """ Keys leaving a1in are remembered as ghosts """
+        if key in self.a1in:
+            del self.a1in[key]
+            self.a1out[key] = None
+            kout = max(1, int((self.max_items or len(self.cache_data)) *
+                              self.KOUT))
+            while len(self.a1out) > kout:
+                self.a1out.popitem(last=False)
+        else:
+            del self.am[key]
+
+    def _on_access(self, key):
+        """ Hits in am refresh the key, hits in a1in do nothing """
+        if key in self.am:
+            self.am.move_to_end(key)
+
+    def _victim(self):
+        """ Oldest of a1in while it is over its share, else LRU of am """
+        kin = max(1, int((self.max_items or len(self.cache_data)) *
+                         self.KIN))
+        if self.a1in and (len(self.a1in) > kin or not self.am):
+            return next(iter(self.a1in))
+        return next(iter(self.am))
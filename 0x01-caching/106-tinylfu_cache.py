@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+""" TinyLFUCache module
+"""
+from collections import OrderedDict
+from base_caching import BaseCaching
+
+
+class CountMinSketch():
+    """ Compact frequency estimator with 4-bit saturating counters
+
+    Counters are halved every `sample` increments, so old popularity
+    fades away.
+    """
+    __slots__ = ("mask", "table", "sample", "additions")
+    DEPTH = 4
+
+    def __init__(self, capacity):
+        """ Size the sketch for about `capacity` distinct hot keys """
+        width = 16
+        while width < capacity:
+            width <<= 1
+        self.mask = width - 1
+        self.table = [bytearray(width) for _ in range(self.DEPTH)]
+        self.sample = 10 * max(capacity, 1)
+        self.additions = 0
+
+    def _hashes(self, key):
+        """ Two independent hashes of key, for double hashing """
+        h = (hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        return h >> 32, (h & 0xFFFFFFFF) | 1
+
+    def increment(self, key):
+        """ Count one more access of key """
+        h1, h2 = self._hashes(key)
+        for row in self.table:
+            i = h1 & self.mask
+            if row[i] < 15:
+                row[i] += 1
+            h1 += h2
+        self.additions += 1
+        if self.additions >= self.sample:
+            self.table = [bytearray(c >> 1 for c in row)
+                          for row in self.table]
+            self.additions //= 2
+
+    def frequency(self, key):
+        """ Estimated access count of key """
+        h1, h2 = self._hashes(key)
+        count = 15
+        for row in self.table:
+            count = min(count, row[h1 & self.mask])
+            h1 += h2
+        return count
+
+
+class TinyLFUCache(BaseCaching):
+    """ TinyLFUCache provides a caching system using W-TinyLFU
+
+    New keys enter a small LRU `window`. When room is needed, the LRU
+    key of the window is only admitted to the main segmented LRU if the
+    sketch says it is more popular than the main cache's victim.
+    The main cache keeps keys seen once in `probation` and keys hit
+    there in `protected`.
+    """
+    WINDOW = 0.01     # Share of the capacity kept for the window
+    PROTECTED = 0.8   # Share of the main cache kept for protected keys
+
+    def __init__(self, *args, **kwargs):
+        """ Initialize the cache """
+        super().__init__(*args, **kwargs)
+        capacity = self.max_items or 1024
+        self.window_size = max(1, int(capacity * self.WINDOW))
+        self.protected_size = max(1, int(
+            (capacity - self.window_size) * self.PROTECTED))
+        self.sketch = CountMinSketch(capacity)
+        self.window = OrderedDict()     # Newest keys, LRU first
+        self.probation = OrderedDict()  # Main keys seen once, LRU first
+        self.protected = OrderedDict()  # Main keys seen again, LRU first
+
+    def _track(self, key):
+        """ New keys enter the window, its overflow goes to probation """
+        self.sketch.increment(key)
+        self.window[key] = None
+        if len(self.window) > self.window_size:
+            moved, _ = self.window.popitem(last=False)
+            self.probation[moved] = None
+
+    def _untrack(self, key):
+        """ Remove a key from its segment """
+        for segment in (self.window, self.probation, self.protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def _on_access(self, key):
+        """ Count the access and promote probation hits """
+        self.sketch.increment(key)
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.probation:
+            del self.probation[key]
+            self.protected[key] = None
+            if len(self.protected) > self.protected_size:
+                demoted, _ = self.protected.popitem(last=False)
+                self.probation[demoted] = None
+        else:
+            self.protected.move_to_end(key)
+
+    def _victim(self):
+        """ Loser of the window candidate against the main victim """
+        main = self.probation or self.protected
+        if not main:
+            return next(iter(self.window))
+        victim = next(iter(main))
+        if len(self.window) < self.window_size:
+            return victim
+        candidate = next(iter(self.window))
+        if self.sketch.frequency(candidate) > self.sketch.frequency(victim):
+            # Admit the candidate, the incoming key takes its window slot
+            del self.window[candidate]
+            self.probation[candidate] = None
+            return victim
+        return candidate
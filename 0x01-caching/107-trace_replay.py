@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+""" 107-trace_replay: replay key traces through every cache policy
+
+Usage: ./107-trace_replay.py [trace_file [capacity]]
+
+A trace file holds one key per line. Without one, synthetic Zipfian,
+scan and mixed (Zipfian interrupted by scans) traces are replayed.
+Each policy reads a key and puts it back on a miss; the hit ratio and
+the throughput are reported side by side.
+"""
+import itertools
+import random
+import sys
+import time
+
+POLICIES = [
+    ('1-fifo_cache', 'FIFOCache'),
+    ('2-lifo_cache', 'LIFOCache'),
+    ('3-lru_cache', 'LRUCache'),
+    ('4-mru_cache', 'MRUCache'),
+    ('100-lfu_cache', 'LFUCache'),
+    ('104-arc_cache', 'ARCCache'),
+    ('105-two_queue_cache', 'TwoQueueCache'),
+    ('106-tinylfu_cache', 'TinyLFUCache'),
+]
+
+
+def zipf_trace(length, keys, s=1.0, seed=0):
+    """ Keys drawn with a Zipfian popularity of exponent s """
+    weights = list(itertools.accumulate(
+        1 / (rank ** s) for rank in range(1, keys + 1)))
+    return random.Random(seed).choices(range(keys), cum_weights=weights,
+                                       k=length)
+
+
+def scan_trace(length, start=0):
+    """ Keys read once each, in order """
+    return list(range(start, start + length))
+
+
+def mixed_trace(length, keys, scan_every=10000, scan_length=5000):
+    """ A Zipfian trace interrupted by one-time scans """
+    trace = []
+    hot = zipf_trace(length, keys)
+    for i in range(0, length, scan_every):
+        trace.extend(hot[i:i + scan_every])
+        trace.extend(scan_trace(scan_length, keys + i * scan_length))
+    return trace
+
+
+def replay(cls, trace, capacity):
+    """ Hit ratio and operations per second of one policy """
+    cache = cls(max_items=capacity, on_evict=[])
+    start = time.perf_counter()
+    for key in trace:
+        if cache.get(key) is None:
+            cache.put(key, True)
+    elapsed = time.perf_counter() - start
+    return cache.stats()["hit_ratio"], len(trace) / elapsed
+
+
+def report(name, trace, capacity):
+    """ Print one line per policy for a trace """
+    print("{} ({} accesses, capacity {})".format(name, len(trace), capacity))
+    print("{:>15} {:>10} {:>12}".format("policy", "hit ratio", "ops/s"))
+    for module, class_name in POLICIES:
+        cls = getattr(__import__(module), class_name)
+        ratio, ops = replay(cls, trace, capacity)
+        print("{:>15} {:>10.4f} {:>12.0f}".format(class_name, ratio, ops))
+    print()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as f:
+            trace = [line.strip() for line in f if line.strip()]
+        capacity = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+        report(sys.argv[1], trace, capacity)
+    else:
+        report("zipf", zipf_trace(200000, 50000), 2000)
+        report("scan", scan_trace(200000), 2000)
+        report("mixed", mixed_trace(200000, 50000), 2000)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+""" 108-bench: bookkeeping bytes per entry, default vs compact storage """
+import tracemalloc
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+compact = __import__('108-compact_cache')
+
+PAIRS = [
+    (LRUCache, compact.CompactLRUCache),
+    (LFUCache, compact.CompactLFUCache),
+]
+
+
+def bytes_per_entry(cls, keys, item):
+    """ Memory allocated by a full cache, excluding keys and items """
+    tracemalloc.start()
+    cache = cls(max_items=len(keys), on_evict=[])
+    for key in keys:
+        cache.put(key, item)
+    for key in keys[::2]:
+        cache.get(key)  # Spread LFU keys over two frequencies
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(keys)
+
+
+if __name__ == "__main__":
+    print("{:>9} {:>10} {:>12} {:>16}".format(
+        "keys", "policy", "default B", "compact B"))
+    for n in (10 ** 4, 10 ** 5, 10 ** 6):
+        keys = list(range(n))  # Created before tracing starts
+        for default, small in PAIRS:
+            print("{:>9} {:>10} {:>12.1f} {:>16.1f}".format(
+                n, default.__name__, bytes_per_entry(default, keys, ""),
+                bytes_per_entry(small, keys, "")))
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+""" Compact caches module
+"""
+from array import array
+from collections.abc import MutableMapping
+from base_caching import BaseCaching
+
+NIL = -1  # End of a linked list of slots
+
+
+class SlotMap(MutableMapping):
+    """ SlotMap is a key -> item mapping with one dict for all keys
+
+    The dict maps each key to a slot number, items live in a list at
+    that slot, and freed slots are reused. Policies keep their own
+    per-slot bookkeeping in parallel arrays indexed the same way.
+    """
+    __slots__ = ("slots", "store", "free")
+
+    def __init__(self):
+        """ Initialize an empty map """
+        self.slots = {}   # Key -> slot
+        self.store = []   # Slot -> item
+        self.free = []    # Slots ready for reuse
+
+    def slot(self, key):
+        """ The slot of a key """
+        return self.slots[key]
+
+    def __getitem__(self, key):
+        """ The item of a key """
+        return self.store[self.slots[key]]
+
+    def get(self, key, default=None):
+        """ The item of a key, or default """
+        slot = self.slots.get(key)
+        return default if slot is None else self.store[slot]
+
+    def __setitem__(self, key, item):
+        """ Store an item, in a reused slot for a new key """
+        slot = self.slots.get(key)
+        if slot is not None:
+            self.store[slot] = item
+        elif self.free:
+            slot = self.slots[key] = self.free.pop()
+            self.store[slot] = item
+        else:
+            self.slots[key] = len(self.store)
+            self.store.append(item)
+
+    def __delitem__(self, key):
+        """ Remove a key and free its slot """
+        slot = self.slots.pop(key)
+        self.store[slot] = None
+        self.free.append(slot)
+
+    def __contains__(self, key):
+        """ Tell if a key is stored """
+        return key in self.slots
+
+    def __iter__(self):
+        """ Iterate over the keys """
+        return iter(self.slots)
+
+    def __len__(self):
+        """ Number of keys """
+        return len(self.slots)
+
+
+class CompactLRUCache(BaseCaching):
+    """ CompactLRUCache provides an LRU caching system in compact storage
+
+    Recency is a doubly linked list of slots held in two int arrays,
+    so each key costs one dict entry and a few array cells.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """ Initialize the cache """
+        super().__init__(*args, **kwargs)
+        self.cache_data = SlotMap()
+        self.prev = array("l")  # Slot -> previous (less recent) slot
+        self.next = array("l")  # Slot -> next (more recent) slot
+        self.head = NIL         # Least recently used slot
+        self.tail = NIL         # Most recently used slot
+        self.keys = []          # Slot -> key, to name the victim
+
+    def _link(self, slot):
+        """ Append a slot at the most recent end """
+        self.prev[slot] = self.tail
+        self.next[slot] = NIL
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self.next[self.tail] = slot
+        self.tail = slot
+
+    def _unlink(self, slot):
+        """ Detach a slot from the list """
+        prev, nxt = self.prev[slot], self.next[slot]
+        if prev == NIL:
+            self.head = nxt
+        else:
+            self.next[prev] = nxt
+        if nxt == NIL:
+            self.tail = prev
+        else:
+            self.prev[nxt] = prev
+
+    def _track(self, key):
+        """ A new key is the most recently used """
+        slot = self.cache_data.slot(key)
+        if slot == len(self.keys):
+            self.keys.append(key)
+            self.prev.append(NIL)
+            self.next.append(NIL)
+        else:
+            self.keys[slot] = key
+        self._link(slot)
+
+    def _untrack(self, key):
+        """ Forget a removed key """
+        slot = self.cache_data.slot(key)
+        self._unlink(slot)
+        self.keys[slot] = None
+
+    def _on_access(self, key):
+        """ Move the accessed key to the most recent end """
+        slot = self.cache_data.slot(key)
+        if slot != self.tail:
+            self._unlink(slot)
+            self._link(slot)
+
+    def _victim(self):
+        """ The least recently used key """
+        return self.keys[self.head]
+
+
+class CompactLFUCache(CompactLRUCache):
+    """ CompactLFUCache provides an LFU caching system in compact storage
+
+    The linked list of slots is kept sorted by frequency, and by recency
+    within a frequency. `tails` maps each frequency to its last slot,
+    so moving a key to the next frequency and evicting are O(1).
+    """
+
+    def __init__(self, *args, **kwargs):
+        """ Initialize the cache """
+        super().__init__(*args, **kwargs)
+        self.freq = array("l")  # Slot -> access frequency
+        self.tails = {}         # Frequency -> last slot of that frequency
+
+    def _insert_after(self, anchor, slot):
+        """ Link a slot right after anchor, or first if anchor is NIL """
+        nxt = self.head if anchor == NIL else self.next[anchor]
+        self.prev[slot] = anchor
+        self.next[slot] = nxt
+        if anchor == NIL:
+            self.head = slot
+        else:
+            self.next[anchor] = slot
+        if nxt == NIL:
+            self.tail = slot
+        else:
+            self.prev[nxt] = slot
+
+    def _leave_group(self, slot):
+        """ Unlink a slot, fixing the tail of its frequency group """
+        freq = self.freq[slot]
+        if self.tails[freq] == slot:
+            prev = self.prev[slot]
+            if prev != NIL and self.freq[prev] == freq:
+                self.tails[freq] = prev
+            else:
+                del self.tails[freq]
+        prev = self.prev[slot]
+        self._unlink(slot)
+        return prev
+
+    def _track(self, key):
+        """ A new key starts with a frequency of 1 """
+        slot = self.cache_data.slot(key)
+        if slot == len(self.keys):
+            self.keys.append(key)
+            self.prev.append(NIL)
+            self.next.append(NIL)
+            self.freq.append(1)
+        else:
+            self.keys[slot] = key
+            self.freq[slot] = 1
+        self._insert_after(self.tails.get(1, NIL), slot)
+        self.tails[1] = slot
+
+    def _untrack(self, key):
+        """ Forget a removed key """
+        slot = self.cache_data.slot(key)
+        self._leave_group(slot)
+        self.keys[slot] = None
+
+    def _on_access(self, key):
+        """ Move a key to the end of the next frequency group """
+        slot = self.cache_data.slot(key)
+        freq = self.freq[slot]
+        prev = self._leave_group(slot)
+        anchor = self.tails.get(freq + 1, self.tails.get(freq, prev))
+        self._insert_after(anchor, slot)
+        self.freq[slot] = freq + 1
+        self.tails[freq + 1] = slot
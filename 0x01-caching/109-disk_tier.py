@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+""" Disk cache tier module
+"""
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import time
+
+RECORD = struct.Struct("<IId")  # Key length, item length, expiry time
+BUCKET = struct.Struct("<QQ")   # Key hash, record offset + 1
+INDEX_HEADER = struct.Struct("<QQ")  # Live keys, tombstones
+EMPTY = 0
+DELETED = 2 ** 64 - 1
+
+
+def key_hash(key_bytes):
+    """ A 64-bit hash of a key that is stable across processes """
+    return int.from_bytes(
+        hashlib.blake2b(key_bytes, digest_size=8).digest(), "little")
+
+
+class DiskTier():
+    """ DiskTier is an append-only segment file with an on-disk index
+
+    Records are appended to `<path>.seg`. `<path>.idx` is an open
+    addressing hash table mapping key hashes to record offsets. Both
+    files are memory-mapped, so reopening a tier reads nothing upfront:
+    lookups only touch the pages of the buckets and records they need,
+    and the key and tombstone counts are kept in the index header.
+    The number of buckets is rounded up to a power of two.
+    A record may carry an expiry time (wall clock, as it outlives the
+    process); expired records read as missing.
+    """
+    LOAD_FACTOR = 0.7
+
+    def __init__(self, path, buckets=1024):
+        """ Open or create the tier files at path """
+        self.path = path
+        self.segment = open(path + ".seg", "a+b")
+        self.segment_map = None
+        self.segment_size = os.path.getsize(path + ".seg")
+        if not os.path.exists(path + ".idx"):
+            self._write_index(path + ".idx",
+                              1 << max(1, (buckets - 1).bit_length()), [])
+        self.index_file = open(path + ".idx", "r+b")
+        self.index = mmap.mmap(self.index_file.fileno(), 0)
+        self.buckets = (len(self.index) - INDEX_HEADER.size) // BUCKET.size
+
+    @property
+    def count(self):
+        """ Number of live keys """
+        return INDEX_HEADER.unpack_from(self.index, 0)[0]
+
+    @count.setter
+    def count(self, value):
+        INDEX_HEADER.pack_into(self.index, 0, value, self.deleted)
+
+    @property
+    def deleted(self):
+        """ Number of tombstones, they lengthen probes too """
+        return INDEX_HEADER.unpack_from(self.index, 0)[1]
+
+    @deleted.setter
+    def deleted(self, value):
+        INDEX_HEADER.pack_into(self.index, 0, self.count, value)
+
+    def _bucket(self, i):
+        """ (hash, offset + 1) stored in bucket i """
+        return BUCKET.unpack_from(self.index,
+                                  INDEX_HEADER.size + i * BUCKET.size)
+
+    def _set_bucket(self, i, h, ref):
+        """ Store (hash, offset + 1) in bucket i """
+        BUCKET.pack_into(self.index, INDEX_HEADER.size + i * BUCKET.size,
+                         h, ref)
+
+    @staticmethod
+    def _write_index(path, buckets, entries):
+        """ Write an index file holding (hash, offset + 1) entries """
+        table = bytearray(INDEX_HEADER.size + buckets * BUCKET.size)
+        INDEX_HEADER.pack_into(table, 0, len(entries), 0)
+        for h, ref in entries:
+            i = h & (buckets - 1)
+            while BUCKET.unpack_from(
+                    table, INDEX_HEADER.size + i * BUCKET.size)[1] != EMPTY:
+                i = (i + 1) & (buckets - 1)
+            BUCKET.pack_into(table, INDEX_HEADER.size + i * BUCKET.size,
+                             h, ref)
+        with open(path, "wb") as f:
+            f.write(table)
+
+    def _entries(self):
+        """ Live (hash, offset + 1) entries of the index """
+        for i in range(self.buckets):
+            h, ref = self._bucket(i)
+            if ref not in (EMPTY, DELETED):
+                yield h, ref
+
+    def _read(self, offset):
+        """ The key bytes, item bytes and expiry of the record at offset
+        """
+        if self.segment_map is None or offset >= len(self.segment_map):
+            self.segment.flush()
+            if self.segment_map is not None:
+                self.segment_map.close()
+            self.segment_map = mmap.mmap(self.segment.fileno(), 0,
+                                         access=mmap.ACCESS_READ)
+        key_len, item_len, expires = RECORD.unpack_from(
+            self.segment_map, offset)
+        start = offset + RECORD.size
+        return (self.segment_map[start:start + key_len],
+                self.segment_map[start + key_len:start + key_len + item_len],
+                expires)
+
+    def _find(self, key_bytes):
+        """ Bucket holding key, or the first free bucket for it
+
+        The load factor counts tombstones, so an EMPTY bucket always
+        ends the probe; it is bounded by the table size all the same.
+        """
+        h = key_hash(key_bytes)
+        i = h & (self.buckets - 1)
+        free = None
+        for _ in range(self.buckets):
+            bucket_h, ref = self._bucket(i)
+            if ref == EMPTY:
+                return (free if free is not None else i), h, False
+            if ref == DELETED:
+                if free is None:
+                    free = i
+            elif bucket_h == h and self._read(ref - 1)[0] == key_bytes:
+                return i, h, True
+            i = (i + 1) & (self.buckets - 1)
+        return free, h, False
+
+    def put(self, key, item, ttl=None):
+        """ Append an item and point the index at it
+
+        ttl is the number of seconds the item lives (None means
+        forever).
+        """
+        expires = 0.0 if ttl is None else time.time() + ttl
+        self._append(pickle.dumps(key), pickle.dumps(item), expires)
+
+    def _append(self, key_bytes, item_bytes, expires):
+        """ Append a record and point the index at it """
+        offset = self.segment_size
+        self.segment.write(RECORD.pack(len(key_bytes), len(item_bytes),
+                                       expires))
+        self.segment.write(key_bytes)
+        self.segment.write(item_bytes)
+        self.segment_size += RECORD.size + len(key_bytes) + len(item_bytes)
+        i, h, found = self._find(key_bytes)
+        if not found:
+            if self._bucket(i)[1] == DELETED:
+                self.deleted -= 1
+            self.count += 1
+        self._set_bucket(i, h, offset + 1)
+        if self.count + self.deleted > self.buckets * self.LOAD_FACTOR:
+            # Grow when live keys fill the table, else drop tombstones
+            grow = self.count > self.buckets * self.LOAD_FACTOR / 2
+            self._resize(self.buckets * 2 if grow else self.buckets)
+
+    def get(self, key):
+        """ The item of a key, or None """
+        return self.get_entry(key)[0]
+
+    def get_entry(self, key):
+        """ The item of a key and its remaining ttl, or (None, None)
+
+        An expired key is deleted and read as missing.
+        """
+        i, h, found = self._find(pickle.dumps(key))
+        if not found:
+            return None, None
+        ref = self._bucket(i)[1]
+        _, item_bytes, expires = self._read(ref - 1)
+        ttl = None
+        if expires:
+            ttl = expires - time.time()
+            if ttl <= 0:
+                self._delete_bucket(i, h)
+                return None, None
+        return pickle.loads(item_bytes), ttl
+
+    def delete(self, key):
+        """ Forget a key, its record stays until compact() """
+        i, h, found = self._find(pickle.dumps(key))
+        if found:
+            self._delete_bucket(i, h)
+
+    def _delete_bucket(self, i, h):
+        """ Leave a tombstone in bucket i """
+        self._set_bucket(i, h, DELETED)
+        self.count -= 1
+        self.deleted += 1
+
+    def _resize(self, buckets):
+        """ Rebuild the index with another number of buckets """
+        entries = list(self._entries())
+        self.index.close()
+        self.index_file.close()
+        self._write_index(self.path + ".idx", buckets, entries)
+        self.index_file = open(self.path + ".idx", "r+b")
+        self.index = mmap.mmap(self.index_file.fileno(), 0)
+        self.buckets = buckets
+
+    def compact(self):
+        """ Rewrite the segment with the live records only """
+        self.segment.flush()
+        for ext in (".seg", ".idx"):
+            if os.path.exists(self.path + ".compact" + ext):
+                os.remove(self.path + ".compact" + ext)
+        tmp = DiskTier(self.path + ".compact", self.buckets)
+        now = time.time()
+        for _, ref in self._entries():
+            key_bytes, item_bytes, expires = self._read(ref - 1)
+            if not expires or expires > now:
+                tmp._append(key_bytes, item_bytes, expires)
+        tmp.close()
+        self.close()
+        for ext in (".seg", ".idx"):
+            os.replace(self.path + ".compact" + ext, self.path + ext)
+        self.__init__(self.path)
+
+    def close(self):
+        """ Flush and close the files """
+        self.segment.flush()
+        if self.segment_map is not None:
+            self.segment_map.close()
+            self.segment_map = None
+        self.segment.close()
+        self.index.flush()
+        self.index.close()
+        self.index_file.close()
+
+    def __len__(self):
+        """ Number of live keys """
+        return self.count
+
+
+class TieredCache():
+    """ TieredCache puts a DiskTier behind an in-memory cache policy
+
+    Entries evicted from memory spill to disk with the rest of their
+    ttl, and a memory miss is looked up on disk and promoted back. A key
+    lives in one tier at a time, so the disk never shadows a newer
+    value. After a restart the memory tier starts empty and refills
+    lazily from the disk tier.
+    """
+
+    def __init__(self, cache, tier):
+        """ Stack a BaseCaching instance over a DiskTier """
+        self.cache = cache
+        self.tier = tier
+        cache.add_evict_callback(self._spill)
+
+    def _ttl(self, key):
+        """ Seconds left before a memory entry expires, or None """
+        deadline = self.cache.expires.get(key)
+        return None if deadline is None else deadline - time.monotonic()
+
+    def _spill(self, key, item):
+        """ Write an evicted entry to disk, unless it already expired """
+        ttl = self._ttl(key)
+        if ttl is None or ttl > 0:
+            self.tier.put(key, item, ttl)
+
+    @property
+    def cache_data(self):
+        """ The in-memory data """
+        return self.cache.cache_data
+
+    def put(self, key, item, ttl=None):
+        """ Add an item in the memory tier, replacing any disk copy """
+        if key is None or item is None:
+            return
+        self.tier.delete(key)
+        self.cache.put(key, item, ttl)
+
+    def get(self, key):
+        """ Get an item from memory, else from disk """
+        if key is None:
+            return self.cache.get(key)
+        cached = key in self.cache.cache_data
+        item = self.cache.get(key)
+        if item is None and cached:
+            # Expired in memory: drop a copy written by flush() too
+            self.tier.delete(key)
+        elif item is None:
+            item, ttl = self.tier.get_entry(key)
+            if item is not None:
+                self.tier.delete(key)
+                self.cache.put(key, item, ttl)
+        return item
+
+    def print_cache(self):
+        """ Print the memory tier """
+        self.cache.print_cache()
+
+    def flush(self):
+        """ Write every in-memory entry to disk, for a warm restart """
+        for key, item in list(self.cache.cache_data.items()):
+            ttl = self._ttl(key)
+            if ttl is None or ttl > 0:
+                self.tier.put(key, item, ttl)
+
+    def close(self):
+        """ Flush the memory tier and close the disk tier """
+        self.flush()
+        self.tier.close()
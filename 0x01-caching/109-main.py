@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+""" 109-main """
+import os
+import tempfile
+LRUCache = __import__('3-lru_cache').LRUCache
+disk_tier = __import__('109-disk_tier')
+DiskTier = disk_tier.DiskTier
+TieredCache = disk_tier.TieredCache
+
+path = os.path.join(tempfile.mkdtemp(), "cache")
+
+my_cache = TieredCache(LRUCache(), DiskTier(path))
+for key in "ABCDEF":
+    my_cache.put(key, key.lower())
+my_cache.print_cache()
+print(my_cache.get("A"))
+my_cache.print_cache()
+my_cache.close()
+
+# Restart: memory is empty, entries come back from disk on demand
+my_cache = TieredCache(LRUCache(on_evict=[]), DiskTier(path))
+my_cache.print_cache()
+print(my_cache.get("E"))
+print(my_cache.get("Z"))
+my_cache.print_cache()
+print(len(my_cache.tier))
+my_cache.tier.compact()
+print(my_cache.get("B"))
+my_cache.close()
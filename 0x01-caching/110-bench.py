@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+""" 110-bench: per-worker LRUCache vs one SharedLRUCache per host """
+import multiprocessing
+import time
+LRUCache = __import__('3-lru_cache').LRUCache
+SharedLRUCache = __import__('110-shared_cache').SharedLRUCache
+zipf_trace = __import__('107-trace_replay').zipf_trace
+
+ACCESSES = 20000
+KEYS = 20000
+CAPACITY = 2000
+
+
+def load(key):
+    """ Stand-in for the expensive work a cache miss costs """
+    return sum(range(2000)) + key
+
+
+def worker(seed, shared, lock, results):
+    """ Replay a Zipfian trace, through a private or the shared cache """
+    if shared is None:
+        cache = LRUCache(max_items=CAPACITY, on_evict=[])
+    else:
+        cache = SharedLRUCache(shared, lock=lock, create=False)
+    hits = 0
+    for key in zipf_trace(ACCESSES, KEYS, seed=seed):
+        if cache.get(key) is None:
+            cache.put(key, load(key))
+        else:
+            hits += 1
+    if shared is not None:
+        cache.close()
+    results.put(hits)
+
+
+def run(processes, shared):
+    """ Hit ratio and wall time of `processes` workers """
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    cache, lock = None, ctx.Lock()
+    if shared:
+        cache = SharedLRUCache(max_items=CAPACITY, slot_size=64, lock=lock)
+    pool = [ctx.Process(target=worker,
+                        args=(seed, cache and cache.name, lock, results))
+            for seed in range(processes)]
+    start = time.perf_counter()
+    for process in pool:
+        process.start()
+    hits = sum(results.get() for _ in pool)
+    for process in pool:
+        process.join()
+    elapsed = time.perf_counter() - start
+    if shared:
+        cache.close()
+        cache.unlink()
+    return hits / (processes * ACCESSES), elapsed
+
+
+if __name__ == "__main__":
+    print("{:>10} {:>8} {:>8} {:>10} {:>8}".format(
+        "processes", "cache", "entries", "hit ratio", "seconds"))
+    for processes in (4, 16):
+        for shared in (False, True):
+            ratio, elapsed = run(processes, shared)
+            entries = CAPACITY if shared else CAPACITY * processes
+            print("{:>10} {:>8} {:>8} {:>10.4f} {:>8.2f}".format(
+                processes, "shared" if shared else "private", entries,
+                ratio, elapsed))
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+""" Shared memory cache module
+
+SharedLRUCache is a standalone LRU, not a BaseCaching policy: it has
+no ttl, no max_bytes, no put_many/get_many and no eviction callbacks.
+Its stats() follow the BaseCaching schema, with expirations always 0
+and bytes None, so the 103 exporter can render them.
+"""
+import multiprocessing
+import pickle
+import struct
+from multiprocessing import shared_memory
+key_hash = __import__('109-disk_tier').key_hash
+
+HEADER = struct.Struct("<12q")
+# magic, max_items, slot_size, buckets, head, tail, count, free_head,
+# hits, misses, evictions, insertions
+MAGIC = 0x5348415245444c52
+SLOT = struct.Struct("<qqQII")  # prev, next, key hash, key len, item len
+BUCKET = struct.Struct("<q")    # slot + 1, 0 when empty
+NIL = -1
+
+
+class SharedLRUCache():
+    """ SharedLRUCache is an LRU cache living in a shared memory slab
+
+    Every process attached to the same slab name sees the same entries.
+    The slab holds a header, a hash index of slot numbers and max_items
+    fixed-size slots linked in LRU order. Keys and items are pickled
+    into their slot, so an entry must fit in slot_size bytes. All
+    operations hold `lock`, a multiprocessing lock shared by the
+    processes (pass the creator's lock to the workers).
+    """
+
+    def __init__(self, name=None, max_items=1024, slot_size=256,
+                 lock=None, create=True):
+        """ Create a slab, or attach to an existing one with create=False
+
+        Attaching requires the creator's lock: a new lock would only be
+        held by this process and exclude nobody.
+        """
+        if not create and lock is None:
+            raise ValueError("attaching to a slab requires its lock")
+        if create and max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        if create and not 0 < slot_size < 2 ** 32:
+            # The SLOT header stores key and item lengths in 32 bits
+            raise ValueError("slot_size must be between 1 and 2 ** 32 - 1")
+        self.lock = multiprocessing.Lock() if lock is None else lock
+        if create:
+            buckets = 2
+            while buckets < 2 * max_items:
+                buckets <<= 1
+            size = (HEADER.size + buckets * BUCKET.size +
+                    max_items * (SLOT.size + slot_size))
+            self.shm = shared_memory.SharedMemory(name, True, size)
+            self.buf = self.shm.buf
+            self.buf[:size] = bytes(size)
+            self._set_header(MAGIC, max_items, slot_size, buckets, NIL, NIL,
+                             0, 0, 0, 0, 0, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name)
+            self.buf = self.shm.buf
+            if self._header()[0] != MAGIC:
+                raise ValueError("{} is not a cache slab".format(name))
+        _, self.max_items, self.slot_size, self.buckets = self._header()[:4]
+        self.index_start = HEADER.size
+        self.slots_start = HEADER.size + self.buckets * BUCKET.size
+        self.name = self.shm.name
+        if create:
+            # Chain every slot in the free list
+            for slot in range(max_items):
+                nxt = slot + 1 if slot + 1 < max_items else NIL
+                self._set_slot(slot, NIL, nxt, 0, 0, 0)
+
+    def _header(self):
+        """ Header fields as a list """
+        return list(HEADER.unpack_from(self.buf, 0))
+
+    def _set_header(self, *fields):
+        """ Write every header field """
+        HEADER.pack_into(self.buf, 0, *fields)
+
+    def _slot_offset(self, slot):
+        """ Offset of a slot in the slab """
+        return self.slots_start + slot * (SLOT.size + self.slot_size)
+
+    def _slot(self, slot):
+        """ prev, next, hash, key len and item len of a slot """
+        return SLOT.unpack_from(self.buf, self._slot_offset(slot))
+
+    def _set_slot(self, slot, prev, nxt, h, key_len, item_len):
+        """ Write the header of a slot """
+        SLOT.pack_into(self.buf, self._slot_offset(slot),
+                       prev, nxt, h, key_len, item_len)
+
+    def _bucket(self, i):
+        """ Slot + 1 stored in bucket i """
+        return BUCKET.unpack_from(self.buf,
+                                  self.index_start + i * BUCKET.size)[0]
+
+    def _set_bucket(self, i, ref):
+        """ Store slot + 1 in bucket i """
+        BUCKET.pack_into(self.buf, self.index_start + i * BUCKET.size, ref)
+
+    def _find(self, key_bytes, h):
+        """ Bucket of a key and its slot, or the free bucket and NIL """
+        mask = self.buckets - 1
+        i = h & mask
+        while True:
+            ref = self._bucket(i)
+            if ref == 0:
+                return i, NIL
+            slot = ref - 1
+            _, _, slot_h, key_len, _ = self._slot(slot)
+            start = self._slot_offset(slot) + SLOT.size
+            if slot_h == h and self.buf[start:start + key_len] == key_bytes:
+                return i, slot
+            i = (i + 1) & mask
+
+    def _unindex(self, i):
+        """ Empty bucket i, shifting back the buckets probing past it """
+        mask = self.buckets - 1
+        j = i
+        while True:
+            self._set_bucket(i, 0)
+            while True:
+                j = (j + 1) & mask
+                ref = self._bucket(j)
+                if ref == 0:
+                    return
+                home = self._slot(ref - 1)[2] & mask
+                # Move j back to i unless its home lies in (i, j]
+                if (i <= j and not i < home <= j) or \
+                        (i > j and not (home > i or home <= j)):
+                    break
+            self._set_bucket(i, ref)
+            i = j
+
+    def _unlink(self, header, slot):
+        """ Detach a slot from the LRU list """
+        prev, nxt, h, key_len, item_len = self._slot(slot)
+        if prev == NIL:
+            header[4] = nxt
+        else:
+            p = self._slot(prev)
+            self._set_slot(prev, p[0], nxt, *p[2:])
+        if nxt == NIL:
+            header[5] = prev
+        else:
+            n = self._slot(nxt)
+            self._set_slot(nxt, prev, *n[1:])
+
+    def _append(self, header, slot, h, key_len, item_len):
+        """ Link a slot at the most recent end """
+        tail = header[5]
+        self._set_slot(slot, tail, NIL, h, key_len, item_len)
+        if tail == NIL:
+            header[4] = slot
+        else:
+            t = self._slot(tail)
+            self._set_slot(tail, t[0], slot, *t[2:])
+        header[5] = slot
+
+    def _release(self, header, i, slot):
+        """ Remove the entry of bucket i and slot, freeing the slot """
+        self._unindex(i)
+        self._unlink(header, slot)
+        self._set_slot(slot, NIL, header[7], 0, 0, 0)
+        header[7] = slot
+        header[6] -= 1
+
+    def put(self, key, item):
+        """ Add an item in the cache
+
+        An entry that does not fit in a slot is not stored, and the
+        key's previous item is dropped rather than left stale.
+        """
+        if key is None or item is None:
+            return
+        key_bytes = pickle.dumps(key)
+        item_bytes = pickle.dumps(item)
+        h = key_hash(key_bytes)
+        with self.lock:
+            header = self._header()
+            i, slot = self._find(key_bytes, h)
+            if len(key_bytes) + len(item_bytes) > self.slot_size:
+                if slot != NIL:
+                    self._release(header, i, slot)
+                    self._set_header(*header)
+                return
+            if slot != NIL:
+                self._unlink(header, slot)
+            else:
+                if header[6] >= self.max_items:
+                    # Evict the least recently used slot
+                    victim = header[4]
+                    victim_h, victim_len = self._slot(victim)[2:4]
+                    start = self._slot_offset(victim) + SLOT.size
+                    j, _ = self._find(
+                        bytes(self.buf[start:start + victim_len]), victim_h)
+                    self._release(header, j, victim)
+                    header[10] += 1
+                    i, _ = self._find(key_bytes, h)
+                slot = header[7]
+                header[7] = self._slot(slot)[1]
+                header[6] += 1
+                header[11] += 1
+                self._set_bucket(i, slot + 1)
+            start = self._slot_offset(slot) + SLOT.size
+            self.buf[start:start + len(key_bytes)] = key_bytes
+            start += len(key_bytes)
+            self.buf[start:start + len(item_bytes)] = item_bytes
+            self._append(header, slot, h, len(key_bytes), len(item_bytes))
+            self._set_header(*header)
+
+    def get(self, key):
+        """ Get an item by key """
+        if key is None:
+            return None
+        key_bytes = pickle.dumps(key)
+        with self.lock:
+            header = self._header()
+            _, slot = self._find(key_bytes, key_hash(key_bytes))
+            if slot == NIL:
+                header[9] += 1
+                self._set_header(*header)
+                return None
+            _, _, h, key_len, item_len = self._slot(slot)
+            self._unlink(header, slot)
+            self._append(header, slot, h, key_len, item_len)
+            header[8] += 1
+            self._set_header(*header)
+            start = self._slot_offset(slot) + SLOT.size + key_len
+            item_bytes = bytes(self.buf[start:start + item_len])
+        return pickle.loads(item_bytes)
+
+    def items(self):
+        """ (key, item) pairs from least to most recently used """
+        pairs = []
+        with self.lock:
+            slot = self._header()[4]
+            while slot != NIL:
+                _, nxt, _, key_len, item_len = self._slot(slot)
+                start = self._slot_offset(slot) + SLOT.size
+                pairs.append((bytes(self.buf[start:start + key_len]),
+                              bytes(self.buf[start + key_len:
+                                             start + key_len + item_len])))
+                slot = nxt
+        return [(pickle.loads(k), pickle.loads(v)) for k, v in pairs]
+
+    def print_cache(self):
+        """ Print the cache """
+        print("Current cache:")
+        for key, item in sorted(self.items()):
+            print("{}: {}".format(key, item))
+
+    def stats(self):
+        """ Counters and current size of the cache """
+        with self.lock:
+            header = self._header()
+        lookups = header[8] + header[9]
+        return {
+            "policy": type(self).__name__,
+            "hits": header[8],
+            "misses": header[9],
+            "hit_ratio": header[8] / lookups if lookups else 0.0,
+            "insertions": header[11],
+            "evictions": header[10],
+            "expirations": 0,
+            "size": header[6],
+            "bytes": None,
+        }
+
+    def close(self):
+        """ Detach from the slab """
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        """ Destroy the slab, once every process closed it """
+        self.shm.unlink()
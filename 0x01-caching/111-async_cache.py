@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+""" Asyncio cache module
+"""
+import asyncio
+import time
+
+
+class AsyncCache():
+    """ AsyncCache is an asyncio facade over any BaseCaching instance
+
+    Concurrent get_or_load calls missing on the same key await one
+    shared load. With stale_after, entries older than that many seconds
+    are still served while a single background reload refreshes them,
+    so readers never wait on a reload. Expiration for good is left to
+    the wrapped cache's ttl.
+    """
+
+    def __init__(self, cache, stale_after=None):
+        """ Wrap a BaseCaching instance """
+        self.cache = cache
+        self.stale_after = stale_after
+        self.in_flight = {}  # Key -> Task loading it
+
+    def get(self, key):
+        """ Get a cached item by key, without loading it """
+        entry = self.cache.get(key)
+        return None if entry is None else entry[0]
+
+    def put(self, key, item, ttl=None):
+        """ Add an item in the cache """
+        if item is not None:
+            self.cache.put(key, (item, time.monotonic()), ttl)
+
+    async def get_or_load(self, key, loader, ttl=None):
+        """ Get an item, awaiting loader() to produce it on a miss
+
+        loader is called without arguments and returns an awaitable.
+        """
+        entry = self.cache.get(key)
+        if entry is not None:
+            item, loaded_at = entry
+            if (self.stale_after is not None and
+                    key not in self.in_flight and
+                    time.monotonic() - loaded_at > self.stale_after):
+                self._load(key, loader, ttl)  # Refresh in the background
+            return item
+        task = self.in_flight.get(key)
+        if task is None:
+            task = self._load(key, loader, ttl)
+        # A cancelled awaiter must not cancel the load others wait on
+        return await asyncio.shield(task)
+
+    def _load(self, key, loader, ttl):
+        """ Start the single load of a key """
+        async def load():
+            """ Await the loader and cache its result """
+            try:
+                item = await loader()
+                self.put(key, item, ttl)
+                return item
+            finally:
+                del self.in_flight[key]
+
+        task = asyncio.get_running_loop().create_task(load())
+        # Background refreshes may fail with nobody awaiting them
+        task.add_done_callback(
+            lambda t: t.cancelled() or t.exception())
+        self.in_flight[key] = task
+        return task
+
+    def stats(self):
+        """ Counters of the wrapped cache, with the loads in flight """
+        return dict(self.cache.stats(), in_flight=len(self.in_flight))
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+""" 111-main """
+import asyncio
+LRUCache = __import__('3-lru_cache').LRUCache
+AsyncCache = __import__('111-async_cache').AsyncCache
+
+calls = []
+
+
+async def load_page():
+    """ Slow loader, recording each call """
+    calls.append(len(calls) + 1)
+    await asyncio.sleep(0.1)
+    return "page v{}".format(len(calls))
+
+
+async def main():
+    """ Coalesced misses, then a stale read refreshed in background """
+    cache = AsyncCache(LRUCache(), stale_after=0.2)
+    pages = await asyncio.gather(
+        *[cache.get_or_load("home", load_page) for _ in range(5)])
+    print(pages, calls)
+    await asyncio.sleep(0.3)
+    print(await cache.get_or_load("home", load_page), calls)
+    await asyncio.sleep(0.2)
+    print(await cache.get_or_load("home", load_page), calls)
+
+
+asyncio.run(main())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+""" 112-bench: filling and reading pages with put/get vs the batch ops """
+import time
+LRUCache = __import__('3-lru_cache').LRUCache
+
+PAGE = 1000
+PAGES = 200
+
+
+def bench(batch):
+    """ Seconds to cache then read PAGES pages of PAGE rows """
+    cache = LRUCache(max_items=10 * PAGE, on_evict=[])
+    pages = [{(page, row): row for row in range(PAGE)}
+             for page in range(PAGES)]
+    start = time.perf_counter()
+    for rows in pages:
+        if batch:
+            cache.put_many(rows)
+            cache.get_many(rows)
+        else:
+            for key, item in rows.items():
+                cache.put(key, item)
+            for key in rows:
+                cache.get(key)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    single = min(bench(False) for _ in range(3))
+    batch = min(bench(True) for _ in range(3))
+    print("{:>10} {:>10}".format("calls", "seconds"))
+    print("{:>10} {:>10.3f}".format("put/get", single))
+    print("{:>10} {:>10.3f}".format("batch", batch))
+    print("speedup {:.2f}".format(single / batch))
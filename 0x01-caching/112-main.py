@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+""" 112-main: batch operations """
+LRUCache = __import__('3-lru_cache').LRUCache
+ARCCache = __import__('104-arc_cache').ARCCache
+
+my_cache = LRUCache()
+my_cache.put_many({"A": "Hello", "B": "World", "C": "Holberton"})
+my_cache.print_cache()
+print(my_cache.get_many(["A", "C", "Z"]))
+my_cache.put_many({"D": "School", "E": "Battery", "A": "Street"})
+my_cache.print_cache()
+print(my_cache.stats())
+
+# A ghost coming back through put_many adapts ARC like put does
+my_cache = ARCCache()
+my_cache.put_many({"A": "Hello", "B": "World", "C": "Holberton",
+                   "D": "School"})
+my_cache.get_many(["A", "B"])
+my_cache.put("E", "Battery")
+print(my_cache.p)
+my_cache.put_many({"C": "Street"})
+print(my_cache.p)
+my_cache.print_cache()
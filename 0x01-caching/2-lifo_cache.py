@@ -1,34 +1,30 @@
 #!/usr/bin/python3
 """ LIFOCache module
 """
+from collections import OrderedDict
 from base_caching import BaseCaching
 
 
 class LIFOCache(BaseCaching):
     """ LIFOCache implements a caching system using the LIFO algorithm """
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """ Initialize the cache """
-        super().__init__()
-        self.keys = []  # List to keep track of the order of keys
+        super().__init__(*args, **kwargs)
+        self.keys = OrderedDict()  # Keys in insertion order
 
-    def put(self, key, item):
-        """ Add an item in the cache """
-        if key is not None and item is not None:
-            if key in self.cache_data:
-                # Update the existing key and move it to the end
-                self.keys.remove(key)
-            elif len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                # Cache is full, pop last item (most recently added) from cache
-                last_key = self.keys.pop()  # LIFO: remove last inserted key
-                del self.cache_data[last_key]  # Remove from cache
-                print("DISCARD: {}".format(last_key))
+    def _track(self, key):
+        """ Track the order of keys """
+        self.keys[key] = None
 
-            self.cache_data[key] = item  # Add the new key-value pair
-            self.keys.append(key)  # Track the order of keys
+    def _untrack(self, key):
+        """ Forget a removed key """
+        del self.keys[key]
 
-    def get(self, key):
-        """ Get an item by key """
-        if key is None or key not in self.cache_data:
-            return None
-        return self.cache_data[key]
+    def _on_update(self, key):
+        """ Updating an existing key moves it to the end """
+        self.keys.move_to_end(key)
+
+    def _victim(self):
+        """ The last inserted key (LIFO) """
+        return next(reversed(self.keys))
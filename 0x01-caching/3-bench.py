@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+""" 3-bench: list-based vs OrderedDict-based LRUCache and MRUCache """
+import contextlib
+import os
+import random
+import time
+BaseCaching = __import__('base_caching').BaseCaching
+LRUCache = __import__('3-lru_cache').LRUCache
+MRUCache = __import__('4-mru_cache').MRUCache
+
+OPS = 1000
+
+
+class ListLRUCache(BaseCaching):
+    """ Previous LRUCache, recency kept in a list """
+
+    def __init__(self, *args, **kwargs):
+        """ Initialize the cache """
+        super().__init__(*args, **kwargs)
+        self.order = []
+
+    def put(self, key, item):
+        """ Add an item in the cache """
+        if key is not None and item is not None:
+            if key in self.cache_data:
+                self.order.remove(key)
+            elif len(self.cache_data) >= self.max_items:
+                lru_key = self.order.pop(0)
+                del self.cache_data[lru_key]
+                print("DISCARD: {}".format(lru_key))
+            self.cache_data[key] = item
+            self.order.append(key)
+
+    def get(self, key):
+        """ Get an item by key """
+        if key is None or key not in self.cache_data:
+            return None
+        self.order.remove(key)
+        self.order.append(key)
+        return self.cache_data[key]
+
+
+class ListMRUCache(ListLRUCache):
+    """ Previous MRUCache, recency kept in a list """
+
+    def put(self, key, item):
+        """ Add an item in the cache """
+        if key is not None and item is not None:
+            if key in self.cache_data:
+                self.order.remove(key)
+            elif len(self.cache_data) >= self.max_items:
+                mru_key = self.order.pop()
+                del self.cache_data[mru_key]
+                print("DISCARD: {}".format(mru_key))
+            self.cache_data[key] = item
+            self.order.append(key)
+
+
+def bench(cls, size):
+    """ Time OPS random gets and OPS evicting puts on a full cache """
+    cache = cls(max_items=size)
+    for i in range(size):
+        cache.put(i, i)
+    keys = [random.randrange(size) for _ in range(OPS)]
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for k in keys:
+            cache.get(k)
+        for k in range(size, size + OPS):
+            cache.put(k, k)
+    return (time.perf_counter() - start) / (2 * OPS) * 1e9
+
+
+if __name__ == "__main__":
+    print("{:>9} {:>14} {:>14} {:>14} {:>14}".format(
+        "keys", "list LRU ns", "LRU ns", "list MRU ns", "MRU ns"))
+    for size in (10 ** 4, 10 ** 5, 10 ** 6):
+        print("{:>9} {:>14.0f} {:>14.0f} {:>14.0f} {:>14.0f}".format(
+            size, bench(ListLRUCache, size), bench(LRUCache, size),
+            bench(ListMRUCache, size), bench(MRUCache, size)))
@@ -1,19 +1,59 @@
 #!/usr/bin/env python3
 """ BaseCaching module
 """
+import heapq
+import sys
+import threading
+import time
+
+
+def print_discard(key, item):
+    """ Default eviction callback, print the discarded key """
+    print("DISCARD: {}".format(key))
 
 
 class BaseCaching():
     """ BaseCaching defines:
       - constants of your caching system
       - where your data are stored (in a dictionary)
+      - the capacity limits: a number of items and an optional byte budget
+      - the optional time to live of the entries
+      - hit, miss and eviction counters, and eviction callbacks
+
+    Subclasses choose what gets evicted by implementing the policy hooks
+    `_admit`, `_track`, `_untrack`, `_on_access`, `_on_update` and
+    `_victim`.
     """
     MAX_ITEMS = 4
 
-    def __init__(self):
+    def __init__(self, max_items=None, max_bytes=None, sizer=None,
+                 ttl=None, on_evict=None):
         """ Initiliaze
+
+        max_items defaults to MAX_ITEMS (None means no item limit).
+        max_bytes is an optional budget measured by `sizer(item)`,
+        which defaults to sys.getsizeof. ttl is the default number of
+        seconds an entry lives (None means forever). on_evict is a list
+        of callbacks called with (key, item) on eviction, it defaults to
+        printing DISCARD lines.
         """
         self.cache_data = {}
+        self.max_items = self.MAX_ITEMS if max_items is None else max_items
+        self.max_bytes = max_bytes
+        self.sizer = sys.getsizeof if sizer is None else sizer
+        self.sizes = {}  # Byte size of each item, kept only with max_bytes
+        self.current_bytes = 0
+        self.ttl = ttl
+        self.expires = {}  # Key -> monotonic deadline, for expiring keys
+        self.deadlines = []  # Heap of (deadline, key), may hold stale pairs
+        self.reaper = None
+        self.evict_callbacks = \
+            [print_discard] if on_evict is None else list(on_evict)
+        self.hits = 0
+        self.misses = 0
+        self.insertions = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def print_cache(self):
         """ Print the cache
@@ -22,14 +62,270 @@ class BaseCaching():
         for key in sorted(self.cache_data.keys()):
             print("{}: {}".format(key, self.cache_data.get(key)))
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """ Add an item in the cache
+
+        ttl overrides the cache's default time to live for this entry.
         """
-        raise NotImplementedError(
-            "put must be implemented in your cache class")
+        if key is None or item is None:
+            return
+        self._admit([] if key in self.cache_data else [key])
+
+        size = 0
+        if self.max_bytes is not None:
+            size = self.sizer(item)
+            if size > self.max_bytes:
+                # The item can never fit, drop the stale value if any
+                if key in self.cache_data:
+                    self._remove(key)
+                return
+
+        # Expired entries make room before any live entry is evicted
+        if self.deadlines and self._over_limit(key, size):
+            self.reap()
+
+        # Evict until both the item and the byte limits are satisfied
+        while self.cache_data and self._over_limit(key, size):
+            self._discard(self._victim())
+
+        self._store(key, item, size, ttl)
+
+    def put_many(self, mapping, ttl=None):
+        """ Add several items in the cache
+
+        The batch is handled as one insertion: room is made once, with
+        victims picked by the policy among the entries already cached
+        (keys of the batch included, they are then stored again), then
+        every item is stored. A batch larger than the cache limits
+        falls back to one put per item.
+        """
+        items = {key: item for key, item in mapping.items()
+                 if key is not None and item is not None}
+        sizes = {}
+        if self.max_bytes is not None:
+            for key, item in list(items.items()):
+                sizes[key] = self.sizer(item)
+                if sizes[key] > self.max_bytes:
+                    # The item can never fit, drop the stale value if any
+                    del items[key], sizes[key]
+                    if key in self.cache_data:
+                        self._remove(key)
+        if ((self.max_items is not None and len(items) > self.max_items) or
+                (self.max_bytes is not None and
+                 sum(sizes.values()) > self.max_bytes)):
+            for key, item in items.items():
+                self.put(key, item, ttl)
+            return
+
+        self._admit([key for key in items if key not in self.cache_data])
+        new = sum(1 for key in items if key not in self.cache_data)
+        extra = sum(size - self.sizes.get(key, 0)
+                    for key, size in sizes.items())
+
+        def over_limit():
+            """ Tell if the whole batch exceeds a limit """
+            return ((self.max_items is not None and
+                     len(self.cache_data) + new > self.max_items) or
+                    (self.max_bytes is not None and
+                     self.current_bytes + extra > self.max_bytes))
+
+        if self.deadlines and over_limit():
+            self.reap()
+            new = sum(1 for key in items if key not in self.cache_data)
+            extra = sum(size - self.sizes.get(key, 0)
+                        for key, size in sizes.items())
+        while self.cache_data and over_limit():
+            victim = self._victim()
+            if victim in items:
+                new += 1
+                extra += self.sizes.get(victim, 0)
+            self._discard(victim)
+
+        for key, item in items.items():
+            self._store(key, item, sizes.get(key, 0), ttl)
+
+    def _store(self, key, item, size, ttl):
+        """ Store an item once there is room for it """
+        if self.max_bytes is not None:
+            self.current_bytes += size - self.sizes.get(key, 0)
+            self.sizes[key] = size
+
+        if key in self.cache_data:
+            self.cache_data[key] = item
+            self._on_update(key)
+        else:
+            self.cache_data[key] = item
+            self._track(key)
+            self.insertions += 1
+
+        if ttl is None:
+            ttl = self.ttl
+        if ttl is None:
+            self.expires.pop(key, None)
+        else:
+            deadline = time.monotonic() + ttl
+            self.expires[key] = deadline
+            heapq.heappush(self.deadlines, (deadline, key))
+            if len(self.deadlines) > 2 * len(self.expires) + 64:
+                # Drop the pairs left behind by updates and removals
+                self.deadlines = [(d, k) for k, d in self.expires.items()]
+                heapq.heapify(self.deadlines)
 
     def get(self, key):
         """ Get an item by key
         """
+        if key is None or key not in self.cache_data:
+            self.misses += 1
+            return None
+        deadline = self.expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._remove(key)  # Lazily drop the expired entry
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._on_access(key)
+        self.hits += 1
+        return self.cache_data[key]
+
+    def get_many(self, keys):
+        """ Get the items of several keys, as a dict of the hits only """
+        found = {}
+        now = time.monotonic()
+        misses = 0
+        for key in keys:
+            if key not in self.cache_data:
+                misses += 1
+                continue
+            deadline = self.expires.get(key)
+            if deadline is not None and deadline <= now:
+                self._remove(key)  # Lazily drop the expired entry
+                self.expirations += 1
+                misses += 1
+                continue
+            self._on_access(key)
+            found[key] = self.cache_data[key]
+        self.hits += len(found)
+        self.misses += misses
+        return found
+
+    def stats(self):
+        """ Counters and current size of the cache
+
+        bytes is None unless a max_bytes budget is set, as item sizes
+        are only measured then.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "policy": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "insertions": self.insertions,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self.cache_data),
+            "bytes": (None if self.max_bytes is None
+                      else self.current_bytes),
+        }
+
+    def add_evict_callback(self, callback):
+        """ Call callback(key, item) on every eviction """
+        self.evict_callbacks.append(callback)
+
+    def reap(self):
+        """ Remove every expired entry, return how many were removed
+
+        Only the expired head of the deadline heap is visited.
+        """
+        now = time.monotonic()
+        removed = 0
+        while self.deadlines and self.deadlines[0][0] <= now:
+            deadline, key = heapq.heappop(self.deadlines)
+            if self.expires.get(key) == deadline:
+                self._remove(key)
+                removed += 1
+        self.expirations += removed
+        return removed
+
+    def start_reaper(self, interval=1.0, lock=None):
+        """ Reap expired entries every `interval` seconds in a thread
+
+        Pass the lock guarding the cache (see LockedCache) when other
+        threads use it too.
+        """
+        if self.reaper is not None:
+            return
+        stop = threading.Event()
+
+        def run():
+            """ Reap until stopped """
+            while not stop.wait(interval):
+                if lock is None:
+                    self.reap()
+                else:
+                    with lock:
+                        self.reap()
+
+        self.reaper = (threading.Thread(target=run, daemon=True), stop)
+        self.reaper[0].start()
+
+    def stop_reaper(self):
+        """ Stop the background reaper """
+        if self.reaper is not None:
+            thread, stop = self.reaper
+            stop.set()
+            thread.join()
+            self.reaper = None
+
+    def _over_limit(self, key, size):
+        """ Tell if storing `size` bytes under `key` exceeds a limit """
+        if (self.max_items is not None and key not in self.cache_data and
+                len(self.cache_data) >= self.max_items):
+            return True
+        return (self.max_bytes is not None and
+                self.current_bytes - self.sizes.get(key, 0) + size >
+                self.max_bytes)
+
+    def _remove(self, key):
+        """ Remove a key from the policy and from the cache """
+        self._untrack(key)
+        del self.cache_data[key]
+        self.current_bytes -= self.sizes.pop(key, 0)
+        self.expires.pop(key, None)
+
+    def _discard(self, key):
+        """ Evict a key chosen by the policy
+
+        Callbacks run before the key is removed, so they can still read
+        its entry, such as its deadline in `expires`.
+        """
+        item = self.cache_data[key]
+        for callback in self.evict_callbacks:
+            callback(key, item)
+        self._remove(key)
+        self.evictions += 1
+
+    def _admit(self, keys):
+        """ Policy hook: keys not cached yet are about to be inserted
+
+        Called by put and put_many before any room is made, with the
+        empty list when only existing keys are updated.
+        """
+
+    def _track(self, key):
+        """ Policy hook: a new key was inserted """
+
+    def _untrack(self, key):
+        """ Policy hook: a key was removed """
+
+    def _on_access(self, key):
+        """ Policy hook: a key was read """
+
+    def _on_update(self, key):
+        """ Policy hook: the item of an existing key was replaced """
+        self._on_access(key)
+
+    def _victim(self):
+        """ Policy hook: the key to evict next """
         raise NotImplementedError(
-            "get must be implemented in your cache class")
+            "_victim must be implemented in your cache class")
@@ -3,13 +3,23 @@
 
 This application serves a home page and retrieves the user's preferred
 language and timezone using Flask-Babel. It supports multiple languages
-and runs on host 0.0.0.0 at port 5000.
+and runs on host 0.0.0.0 at port 5000. Rendered pages are cached per
+locale, user, timezone and minute, and served with an ETag.
 """
 
+import hashlib
+import os
+import threading
+import time
 import pytz
-from flask import Flask, request, render_template, g
-from flask_babel import Babel
-from typing import Union, Dict
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from flask import Flask, request, render_template, g, make_response
+from flask_babel import Babel, format_datetime, get_locale as babel_locale
+from typing import Union, Dict, Optional, Tuple
+from werkzeug.datastructures import LanguageAccept
+from werkzeug.http import parse_accept_header
 
 
 class Config:
@@ -31,6 +41,17 @@ app.config.from_object(Config)
 app.url_map.strict_slashes = False
 babel = Babel(app)
 
+# Supported languages as a set, and bound of the resolution caches
+LANGUAGES = frozenset(app.config["LANGUAGES"])
+RESOLVE_CACHE_SIZE = 1024
+
+# Rendered pages: (template, locale, user, timezone, time bucket,
+# sources version) -> (html, etag), least recently used dropped first
+PAGE_CACHE_SIZE = 1024
+TIME_BUCKET = 60  # Seconds a rendered current time stays valid
+page_cache = OrderedDict()
+page_cache_lock = threading.Lock()
+
 # Sample user data for demonstration
 users = {
     1: {"name": "Balou", "locale": "fr", "timezone": "Europe/Paris"},
@@ -63,6 +84,42 @@ def before_request() -> None:
     g.user = user
 
 
+@lru_cache(maxsize=RESOLVE_CACHE_SIZE)
+def best_language(accept_language: str) -> Optional[str]:
+    """Negotiate a supported language from an Accept-Language header.
+
+    Results are memoized, so a header seen before costs one dict
+    lookup instead of being parsed and matched again.
+
+    Args:
+        accept_language (str): The normalized Accept-Language header.
+
+    Returns:
+        Optional[str]: The best matched language, if any.
+    """
+    return parse_accept_header(accept_language, LanguageAccept).best_match(
+        app.config["LANGUAGES"])
+
+
+@lru_cache(maxsize=RESOLVE_CACHE_SIZE)
+def resolve_timezone(timezone: str) -> str:
+    """Resolve a timezone name to its canonical zone.
+
+    Unknown names resolve to the default timezone, and that result is
+    memoized too, so they raise UnknownTimeZoneError only once.
+
+    Args:
+        timezone (str): The requested timezone name.
+
+    Returns:
+        str: The canonical zone name or the default timezone.
+    """
+    try:
+        return pytz.timezone(timezone).zone
+    except pytz.exceptions.UnknownTimeZoneError:
+        return app.config['BABEL_DEFAULT_TIMEZONE']
+
+
 @babel.localeselector
 def get_locale() -> str:
     """Retrieve the best matching locale for the web page.
@@ -74,14 +131,15 @@ def get_locale() -> str:
         str: The best matched language based on the priority.
     """
     locale = request.args.get('locale', '')
-    if locale in app.config["LANGUAGES"]:
+    if locale in LANGUAGES:
         return locale
-    if g.user and g.user['locale'] in app.config["LANGUAGES"]:
+    if g.user and g.user['locale'] in LANGUAGES:
         return g.user['locale']
     header_locale = request.headers.get('locale', '')
-    if header_locale in app.config["LANGUAGES"]:
+    if header_locale in LANGUAGES:
         return header_locale
-    return request.accept_languages.best_match(app.config["LANGUAGES"])
+    accept_language = request.headers.get('Accept-Language', '')
+    return best_language(''.join(accept_language.split()).lower())
 
 
 @babel.timezoneselector
@@ -97,20 +155,84 @@ def get_timezone() -> str:
     timezone = request.args.get('timezone', '').strip()
     if not timezone and g.user:
         timezone = g.user['timezone']
-    try:
-        return pytz.timezone(timezone).zone
-    except pytz.exceptions.UnknownTimeZoneError:
-        return app.config['BABEL_DEFAULT_TIMEZONE']
+    return resolve_timezone(timezone)
+
+
+def sources_version(template: str) -> Tuple:
+    """Modification times of a template and the translation catalogs.
+
+    A rendered page is only valid for the version it was rendered
+    from, so editing the template or recompiling a catalog retires it.
+
+    Args:
+        template (str): The template name.
+
+    Returns:
+        Tuple: One modification time per file, None if it is missing.
+    """
+    paths = [os.path.join(app.root_path, app.template_folder, template)]
+    paths.extend(os.path.join(app.root_path, 'translations', language,
+                              'LC_MESSAGES', 'messages.mo')
+                 for language in app.config["LANGUAGES"])
+    version = []
+    for path in paths:
+        try:
+            version.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            version.append(None)
+    return tuple(version)
+
+
+def render_cached(template: str) -> Tuple[str, str, int]:
+    """Render a template, or reuse the page rendered for this request.
+
+    The page depends on the locale, the user, the timezone and the
+    current time, which is shown to the minute (TIME_BUCKET).
+
+    Args:
+        template (str): The template name.
+
+    Returns:
+        Tuple: The HTML, its ETag and the seconds it stays valid.
+    """
+    now = time.time()
+    bucket = int(now // TIME_BUCKET)
+    user_id = request.args.get('login_as') if g.user else None
+    key = (template, str(babel_locale()), user_id, get_timezone(),
+           bucket, sources_version(template))
+    with page_cache_lock:
+        cached = page_cache.get(key)
+        if cached is not None:
+            page_cache.move_to_end(key)
+    if cached is None:
+        g.time = format_datetime(
+            datetime.fromtimestamp(bucket * TIME_BUCKET, pytz.utc))
+        html = render_template(template)
+        etag = hashlib.blake2b(html.encode(), digest_size=16).hexdigest()
+        cached = (html, etag)
+        with page_cache_lock:
+            page_cache[key] = cached
+            if len(page_cache) > PAGE_CACHE_SIZE:
+                page_cache.popitem(last=False)
+    html, etag = cached
+    return html, etag, int((bucket + 1) * TIME_BUCKET - now)
 
 
 @app.route('/')
-def get_index() -> str:
+def get_index():
     """Render the home/index page.
 
     Returns:
-        str: Rendered HTML template for the home page.
+        Response: Rendered HTML page for the home page, or a 304 when
+        the client's If-None-Match matches its ETag.
     """
-    return render_template('index.html')
+    html, etag, max_age = render_cached('index.html')
+    response = make_response(html)
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    response.vary.update(('Accept-Language', 'locale'))
+    return response.make_conditional(request)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Compare two result files of run_benchmarks.py.
+
+Usage: ./benchmarks/compare_benchmarks.py old.json new.json [threshold]
+
+Prints the change of every throughput measured in both files and exits
+with status 1 when one dropped by more than `threshold` (0.1 = 10% by
+default), so the script can gate a commit.
+"""
+
+import json
+import sys
+
+
+def throughputs(results, path=()):
+    """Yield (path, ops_per_s) for every timed benchmark."""
+    for key, value in results.items():
+        if isinstance(value, dict):
+            if 'ops_per_s' in value:
+                yield path + (key,), value['ops_per_s']
+            else:
+                yield from throughputs(value, path + (key,))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        sys.exit(__doc__.split('\n\n')[1])
+    with open(sys.argv[1]) as f:
+        old = json.load(f)
+    with open(sys.argv[2]) as f:
+        new = json.load(f)
+    threshold = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+
+    print("{} -> {}".format(old.get('commit'), new.get('commit')))
+    before = dict(throughputs(old['results']))
+    regressions = 0
+    for path, ops in throughputs(new['results']):
+        if path not in before:
+            continue
+        change = ops / before[path] - 1
+        flag = ''
+        if change < -threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        print("{:<50} {:>12.0f} {:>12.0f} {:>+8.1%}{}".format(
+            '/'.join(path), before[path], ops, change, flag))
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for pagination, caching and i18n.
+
+Usage: ./benchmarks/run_benchmarks.py [-o results.json] [--rows N,...]
+                                      [--only pagination,caching,i18n]
+
+Every benchmark is timed with the stdlib: a timed call is repeated
+REPEAT times and the fastest and median runs are kept. Results are
+written as JSON along with the commit they were measured on, so two
+runs can be compared with compare_benchmarks.py.
+
+Pagination servers read a synthetic baby names file of each size in
+--rows (1e4 to 1e6 by default; pass 10000000 for the 1e7 run, which
+needs several GB of memory). The i18n benchmark is skipped when Flask,
+Flask-Babel or pytz is not installed.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGINATION_DIR = os.path.join(ROOT, '0x00-pagination')
+CACHING_DIR = os.path.join(ROOT, '0x01-caching')
+I18N_DIR = os.path.join(ROOT, '0x02-i18n')
+
+REPEAT = 5
+CALLS = 1000  # Calls per timed run
+PAGE_SIZE = 10
+TRACE_LENGTH = 100000
+TRACE_KEYS = 20000
+CAPACITY = 1000
+
+
+def timed(func, args_list, repeat=REPEAT):
+    """Time func over every args tuple of args_list, `repeat` times.
+
+    Returns:
+    dict: Fastest and median seconds per call, and calls per second.
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        runs.append((time.perf_counter() - start) / len(args_list))
+    best, median = min(runs), statistics.median(runs)
+    return {'best_s': best, 'median_s': median, 'ops_per_s': 1 / median}
+
+
+def server_class(module, path):
+    """Server class of a pagination module reading `path`."""
+    cls = __import__(module).Server
+    return type('Server', (cls,), {'DATA_FILE': path})
+
+
+def bench_pagination(sizes):
+    """Time index_range, get_page, get_hyper and get_hyper_index."""
+    sys.path.insert(0, PAGINATION_DIR)
+    make_csv = __import__('8-bench').make_csv
+    index_range = __import__('0-simple_helper_function').index_range
+    results = {}
+    directory = tempfile.mkdtemp()
+    for rows in sizes:
+        path = os.path.join(directory, 'names_{}.csv'.format(rows))
+        make_csv(path, rows)
+        rand = random.Random(rows)
+        pages = [(rand.randint(1, rows // PAGE_SIZE), PAGE_SIZE)
+                 for _ in range(CALLS)]
+        result = {'index_range': timed(index_range, pages)}
+
+        server = server_class('1-simple_pagination', path)()
+        start = time.perf_counter()
+        server.dataset()
+        result['load_s'] = time.perf_counter() - start
+        result['get_page'] = timed(server.get_page, pages)
+
+        server = server_class('2-hypermedia_pagination', path)()
+        server.dataset()
+        result['get_hyper'] = timed(server.get_hyper, pages)
+
+        server = server_class('3-hypermedia_del_pagination', path)()
+        server.indexed_dataset()
+        for index in rand.sample(range(rows), rows // 100):
+            server.delete_row(index)  # 1% of the rows are deleted
+        end = server.indexed_dataset().end()
+        indexes = [(rand.randrange(end), PAGE_SIZE) for _ in range(CALLS)]
+        result['get_hyper_index'] = timed(server.get_hyper_index, indexes)
+
+        results[str(rows)] = result
+        del server
+        os.remove(path)
+    os.rmdir(directory)
+    return results
+
+
+def bench_caching():
+    """Replay uniform, Zipfian, scan and mixed traces through every policy.
+
+    The mixed trace is Zipfian traffic interrupted by scans.
+    """
+    sys.path.insert(0, CACHING_DIR)
+    traces = __import__('107-trace_replay')
+    policies = [('0-basic_cache', 'BasicCache')] + traces.POLICIES + [
+        ('108-compact_cache', 'CompactLRUCache'),
+        ('108-compact_cache', 'CompactLFUCache'),
+    ]
+    rand = random.Random(0)
+    workloads = {
+        'uniform': [rand.randrange(TRACE_KEYS)
+                    for _ in range(TRACE_LENGTH)],
+        'zipf': traces.zipf_trace(TRACE_LENGTH, TRACE_KEYS),
+        'scan': traces.scan_trace(TRACE_LENGTH),
+        'mixed': traces.mixed_trace(TRACE_LENGTH, TRACE_KEYS),
+    }
+    results = {}
+    for module, class_name in policies:
+        cls = getattr(__import__(module), class_name)
+        results[class_name] = {}
+        for name, trace in workloads.items():
+            # BasicCache has no eviction policy, so it is left unbounded
+            capacity = None if cls.MAX_ITEMS is None else CAPACITY
+            runs = [traces.replay(cls, trace, capacity)
+                    for _ in range(REPEAT)]
+            ops = [ops for _, ops in runs]
+            results[class_name][name] = {
+                'hit_ratio': runs[0][0],
+                'best_ops_per_s': max(ops),
+                'ops_per_s': statistics.median(ops),
+            }
+    return results
+
+
+def bench_i18n():
+    """Time the i18n app's / route through the Flask test client."""
+    sys.path.insert(0, I18N_DIR)
+    cwd = os.getcwd()
+    os.chdir(I18N_DIR)  # Babel finds translations relative to the app
+    try:
+        app = __import__('app').app
+    except ImportError as e:
+        return {'skipped': str(e)}
+    finally:
+        os.chdir(cwd)
+    client = app.test_client()
+    requests = {
+        'anonymous': ('/', {}),
+        'locale_arg': ('/?locale=fr', {}),
+        'accept_language': ('/', {'Accept-Language': 'fr-CH, fr;q=0.9'}),
+        'login_as': ('/?login_as=1', {}),
+        'timezone_arg': ('/?login_as=2&timezone=Europe/Kyiv', {}),
+    }
+    results = {}
+    for name, (url, headers) in requests.items():
+        results[name] = timed(
+            lambda url=url, headers=headers: client.get(url, headers=headers),
+            [()] * (CALLS // 10))
+    return results
+
+
+def git_commit():
+    """Commit of the working tree, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('-o', '--output', help="JSON file (default stdout)")
+    parser.add_argument('--rows', default='10000,100000,1000000',
+                        help="comma separated pagination dataset sizes")
+    parser.add_argument('--only', default='pagination,caching,i18n',
+                        help="comma separated benchmark groups")
+    args = parser.parse_args()
+
+    groups = {
+        'pagination': lambda: bench_pagination(
+            [int(float(rows)) for rows in args.rows.split(',')]),
+        'caching': bench_caching,
+        'i18n': bench_i18n,
+    }
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': {},
+    }
+    for group in args.only.split(','):
+        print("running {}...".format(group), file=sys.stderr)
+        report['results'][group] = groups[group]()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)